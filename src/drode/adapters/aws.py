@@ -1,10 +1,8 @@
 """Gather the integration with the AWS boto library."""
 
 import logging
-from typing import Dict, List
+from typing import Any, Dict, List
 
-import boto3
-from botocore.exceptions import ClientError, NoRegionError
 from pydantic import BaseModel  # noqa: E0611
 from pydantic import Field
 
@@ -30,10 +28,40 @@ class AutoscalerInfo(BaseModel):
 
 
 class AWS:
-    """AWS adapter."""
+    """AWS adapter.
+
+    The boto clients are created the first time they're used and reused afterwards,
+    as building them is slow and they keep the connections to AWS open between calls.
+
+    boto3 and botocore are imported inside the methods that use them, as their
+    import time is big and most of the commands don't interact with AWS.
+    """
+
+    def __init__(self) -> None:
+        """Prepare the cache of the boto clients."""
+        self._session: Any = None
+        self._clients: Dict[str, Any] = {}
+
+    # ANN401: boto doesn't have type hints
+    def _client(self, service_name: str) -> Any:  # noqa: ANN401
+        """Return the boto client of a service, creating it the first time."""
+        if service_name not in self._clients:
+            # C0415: import outside toplevel. See the class docstring.
+            import boto3  # noqa: C0415
+            from botocore.config import Config  # noqa: C0415
+
+            if self._session is None:
+                self._session = boto3.session.Session()
+            self._clients[service_name] = self._session.client(
+                service_name,
+                config=Config(
+                    tcp_keepalive=True,
+                    retries={"max_attempts": 5, "mode": "adaptive"},
+                ),
+            )
+        return self._clients[service_name]
 
-    @staticmethod
-    def check_configuration() -> None:
+    def check_configuration(self) -> None:
         """Check if the client is able to interact with the AWS server.
 
         Makes sure that the AWS is correctly configured.
@@ -41,16 +69,21 @@ class AWS:
         Raises:
             AWSConfigurationError: if any of the checks fail.
         """
+        # C0415: import outside toplevel. See the class docstring.
+        from botocore.exceptions import ClientError, NoRegionError  # noqa: C0415
+
         try:
-            ec2 = boto3.client("ec2")
-            ec2.describe_regions()
+            # Creating the EC2 client checks that there is a region configured, which
+            # the STS global endpoint doesn't need. STS is the cheapest authenticated
+            # call to check the credentials.
+            self._client("ec2")
+            self._client("sts").get_caller_identity()
         except (NoRegionError, ClientError) as error:
             log.error("AWS: KO")
             raise AWSConfigurationError(error) from error
         log.info("AWS: OK")
 
-    @staticmethod
-    def get_autoscaling_group(autoscaling_name: str) -> AutoscalerInfo:
+    def get_autoscaling_group(self, autoscaling_name: str) -> AutoscalerInfo:
         """Get information of the autoscaling group and associated resources. # noqa
 
         Args:
@@ -74,32 +107,94 @@ class AWS:
         Raises:
             AWSStateError: If no autoscaling groups are found with that name.
         """
-        ec2 = boto3.client("ec2")
-        autoscaling = boto3.client("autoscaling")
+        return self.get_autoscaling_groups([autoscaling_name])[autoscaling_name]
 
-        autoscaler_info = AutoscalerInfo()
+    def get_autoscaling_groups(
+        self, autoscaling_names: List[str]
+    ) -> Dict[str, AutoscalerInfo]:
+        """Get information of several autoscaling groups and associated resources.
 
-        try:
-            autoscaling_group = autoscaling.describe_auto_scaling_groups(
-                AutoScalingGroupNames=[autoscaling_name]
-            )["AutoScalingGroups"][0]
-            try:
-                autoscaler_info.template = autoscaling_group["LaunchConfigurationName"]
-            except KeyError:
-                autoscaler_info.template = (
-                    f'{autoscaling_group["LaunchTemplate"]["LaunchTemplateName"][:35]}'
-                    f':{autoscaling_group["LaunchTemplate"]["Version"]}'
+        All the groups are fetched in one query, and all their instances in another.
+
+        Args:
+            autoscaling_names: Autoscaling group names, up to 100.
+
+        Returns:
+            autoscaler_infos: Information of each autoscaling group indexed by it's
+                name. See get_autoscaling_group for the schema.
+
+        Raises:
+            AWSStateError: If any of the autoscaling groups doesn't exist.
+        """
+        # An empty AutoScalingGroupNames list would return every group of the account.
+        if not autoscaling_names:
+            return {}
+
+        ec2 = self._client("ec2")
+        autoscaling = self._client("autoscaling")
+
+        pages = autoscaling.get_paginator("describe_auto_scaling_groups").paginate(
+            AutoScalingGroupNames=autoscaling_names
+        )
+        autoscaling_groups = {
+            group["AutoScalingGroupName"]: group
+            for page in pages
+            for group in page["AutoScalingGroups"]
+        }
+        for autoscaling_name in autoscaling_names:
+            if autoscaling_name not in autoscaling_groups:
+                raise AWSStateError(
+                    f"There are no autoscaling groups named {autoscaling_name}"
                 )
 
-        except IndexError as error:
-            raise AWSStateError(
-                f"There are no autoscaling groups named {autoscaling_name}"
-            ) from error
+        # Fetch the data of all the instances in one call. An empty InstanceIds list
+        # would return every instance of the account, hence the guard. The paginator
+        # follows the NextToken if AWS splits the response.
+        instance_ids = [
+            instance_data["InstanceId"]
+            for autoscaling_group in autoscaling_groups.values()
+            for instance_data in autoscaling_group["Instances"]
+        ]
+        ec2_instances = {}
+        if instance_ids:
+            pages = ec2.get_paginator("describe_instances").paginate(
+                InstanceIds=instance_ids
+            )
+            ec2_instances = {
+                instance["InstanceId"]: instance
+                for page in pages
+                for reservation in page["Reservations"]
+                for instance in reservation["Instances"]
+            }
+
+        return {
+            autoscaling_name: self._autoscaler_info(
+                autoscaling_groups[autoscaling_name], ec2_instances
+            )
+            for autoscaling_name in autoscaling_names
+        }
+
+    @staticmethod
+    def _autoscaler_info(
+        autoscaling_group: Dict[str, Any], ec2_instances: Dict[str, Dict[str, Any]]
+    ) -> AutoscalerInfo:
+        """Build the information of an autoscaling group from the AWS responses.
+
+        Args:
+            autoscaling_group: describe_auto_scaling_groups data of the group.
+            ec2_instances: describe_instances data of the instances indexed by id.
+        """
+        autoscaler_info = AutoscalerInfo()
+        try:
+            autoscaler_info.template = autoscaling_group["LaunchConfigurationName"]
+        except KeyError:
+            autoscaler_info.template = (
+                f'{autoscaling_group["LaunchTemplate"]["LaunchTemplateName"][:35]}'
+                f':{autoscaling_group["LaunchTemplate"]["Version"]}'
+            )
 
         for instance_data in autoscaling_group["Instances"]:
-            ec2_data = ec2.describe_instances(
-                InstanceIds=[instance_data["InstanceId"]]
-            )["Reservations"][0]["Instances"][0]
+            ec2_data = ec2_instances[instance_data["InstanceId"]]
             try:
                 instance_template = instance_data["LaunchConfigurationName"][:35]
             except KeyError:
@@ -108,6 +203,9 @@ class AWS:
                     f':{instance_data["LaunchTemplate"]["Version"]}'
                 )
 
+            # boto returns aware datetimes, we don't want the UTC offset in the output
+            launch_time = ec2_data["LaunchTime"].replace(tzinfo=None)
+
             autoscaler_info.instances.append(
                 {
                     "Instance": instance_data["InstanceId"],
@@ -116,7 +214,7 @@ class AWS:
                         f"{instance_data['HealthStatus']}/"
                         f"{instance_data['LifecycleState']}"
                     ),
-                    "Created": ec2_data["LaunchTime"].strftime("%Y-%m-%dT%H:%M"),
+                    "Created": launch_time.isoformat(timespec="minutes"),
                     "Template": instance_template,
                 }
             )
@@ -1,14 +1,31 @@
 """Gather the integration with the Drone web application."""
 
 import logging
-from dataclasses import dataclass
-from inspect import signature
-from typing import Any, List, Optional
+import random
+import time
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Union
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Use orjson to decode the API responses if it's installed, as it's much faster than
+# the standard library.
+try:
+    from orjson import loads
+except ImportError:  # pragma: no cover
+    from json import loads
 
 log = logging.getLogger(__name__)
 
+# Number of builds requested on each page of the builds endpoint, and maximum number
+# of pages to go through when searching for a build.
+BUILDS_PER_PAGE = 25
+MAX_BUILD_PAGES = 4
+# Seconds to wait before retrying a failed request, doubled on each retry.
+RETRY_DELAY = 0.1
+
 
 class DroneConfigurationError(Exception):
     """Exception to gather drone client configuration errors."""
@@ -27,7 +44,7 @@ class DronePromoteError(Exception):
 
 
 # R0902: Too many attributes, but it's a model, so it doesn't mind
-@dataclass  # noqa: R0902
+@dataclass(frozen=True)  # noqa: R0902
 class BuildInfo:  # noqa: R0902
     """Build information schema."""
 
@@ -52,17 +69,16 @@ class BuildInfo:  # noqa: R0902
     sender: Optional[str] = None
     stages: Optional[List[Any]] = None
 
+    # Names of the fields of the model, filled once the dataclass is defined.
+    _FIELDS: ClassVar[FrozenSet[str]] = frozenset()
+
     @classmethod
     def from_kwargs(cls, **kwargs: Any) -> "BuildInfo":  # noqa: ANN401
         """Load only the attributes of the class, ignore the rest."""
-        # Fetch the constructor's signature
-        cls_fields = set(signature(cls).parameters)
-
         # split the kwargs into native ones and new ones
-        native_args = {}
-        for key, value in kwargs.items():
-            if key in cls_fields:
-                native_args[key] = value
+        native_args = {
+            key: value for key, value in kwargs.items() if key in cls._FIELDS
+        }
 
         # Use the native ones to create the class
         entity = cls(**native_args)
@@ -78,37 +94,70 @@ class BuildInfo:  # noqa: R0902
         return self.id < other.id
 
 
+# W0212: Access to a protected member, it's the class we've just defined.
+BuildInfo._FIELDS = frozenset(field.name for field in fields(BuildInfo))  # noqa: W0212
+
+
 class Drone:
     """Drone adapter.
 
     Attributes:
         drone_url: Drone API server base url.
         drone_token: Drone token to interact with the API.
+        session: HTTP session shared by all the requests to the API.
     """
 
     def __init__(self, drone_url: str, drone_token: str) -> None:
         """Configure the connection details."""
         self.drone_url = drone_url
         self.drone_token = drone_token
-
-    def builds(self, project_pipeline: str) -> List[BuildInfo]:
+        # Reuse the same connection to the server between requests, so we don't pay
+        # the TCP and TLS handshakes on each call, for example while polling in wait.
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = f"Bearer {self.drone_token}"
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def builds(
+        self, project_pipeline: str, page: int = 1, branch: Optional[str] = None
+    ) -> List[BuildInfo]:
         """Return the builds of a project pipeline.
 
         Args:
             project_pipeline: Drone pipeline identifier.
                 In the format of `repo_owner/repo_name`.
+            page: Page of the build history to fetch, starting with the newest
+                builds.
+            branch: If set, return only the builds of that branch. The filter is
+                done by the Drone server.
 
         Returns:
-            info: all builds information.
+            info: builds information of the page.
         """
-        build_history = self.get(
-            f"{self.drone_url}/api/repos/{project_pipeline}/builds"
-        ).json()
+        build_history = self._build_history(project_pipeline, page, branch)
 
         builds = [BuildInfo.from_kwargs(**build_data) for build_data in build_history]
 
         return builds
 
+    def _build_history(
+        self, project_pipeline: str, page: int = 1, branch: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Return the raw data of a page of builds of a project pipeline.
+
+        Args:
+            project_pipeline: Drone pipeline identifier.
+                In the format of `repo_owner/repo_name`.
+            page: Page of the build history to fetch.
+            branch: If set, return only the builds of that branch.
+        """
+        query: Dict[str, Union[str, int]] = {"page": page, "per_page": BUILDS_PER_PAGE}
+        if branch is not None:
+            query["branch"] = branch
+        url = f"{self.drone_url}/api/repos/{project_pipeline}/builds?{urlencode(query)}"
+        return loads(self.get(url).content)
+
     def build_info(self, project_pipeline: str, build_number: int) -> BuildInfo:
         """Return the information of the build.
 
@@ -121,9 +170,12 @@ class Drone:
             info: build information.
         """
         try:
-            build_data = self.get(
-                f"{self.drone_url}/api/repos/{project_pipeline}/builds/{build_number}"
-            ).json()[0]
+            build_data = loads(
+                self.get(
+                    f"{self.drone_url}/api/repos/{project_pipeline}"
+                    f"/builds/{build_number}"
+                ).content
+            )[0]
             return BuildInfo.from_kwargs(**build_data)
         except DroneAPIError as error:
             raise DroneBuildError(
@@ -146,35 +198,37 @@ class Drone:
             response: Requests response
 
         Raises:
-            DroneAPIError: If the drone API returns a response with status code != 200.
+            DroneAPIError: If the drone API doesn't return a successful response after
+                max_retries attempts. Only connection errors, 5xx and 429 responses
+                are retried, the rest of the client errors are raised at once. The
+                time between attempts starts at RETRY_DELAY seconds and doubles on
+                each retry.
         """
-        retry = 0
-        while retry < max_retries:
+        error_message = f"Error while trying to access {url}"
+        delay = RETRY_DELAY
+        for attempt in range(max_retries):
             try:
-                if method == "post":
-                    response = requests.post(
-                        url,
-                        headers={"Authorization": f"Bearer {self.drone_token}"},
-                        timeout=2,
-                    )
-                else:
-                    response = requests.get(
-                        url,
-                        headers={"Authorization": f"Bearer {self.drone_token}"},
-                        timeout=2,
-                    )
-
-                if response.status_code == 200:
-                    return response
-                retry += 1
-                log.debug(f"There was an error fetching url {url}")
-            except requests.exceptions.RequestException:
-                retry += 1
-                log.debug(f"There was an error fetching url {url}")
-
-        raise DroneAPIError(
-            f"{response.status_code} error while trying to access {url}"
-        )
+                response = self.session.request(method, url, timeout=2)
+                response.raise_for_status()
+                return response
+            except requests.exceptions.HTTPError as error:
+                error_message = (
+                    f"{response.status_code} error while trying to access {url}"
+                )
+                # Retrying won't fix a wrong token or a missing resource.
+                if response.status_code < 500 and response.status_code != 429:
+                    raise DroneAPIError(error_message) from error
+            except requests.exceptions.RequestException as error:
+                error_message = f"{error} while trying to access {url}"
+            log.debug(f"There was an error fetching url {url}")
+            if attempt < max_retries - 1:
+                # Back off exponentially, with some jitter so that clients that
+                # failed at the same time don't retry at the same time.
+                # S311: random is not used for security purposes.
+                time.sleep(delay * random.uniform(1, 1.5))  # noqa: S311
+                delay *= 2
+
+        raise DroneAPIError(error_message)
 
     def check_configuration(self) -> None:
         """Check if the client is able to interact with the server.
@@ -221,13 +275,20 @@ class Drone:
         Returns:
             info: last successful build number information.
         """
-        for build in self.builds(project_pipeline):
-            if (
-                build.status == "success"
-                and build.target == branch
-                and build.event == "push"
-            ):
-                return build
+        # Drone can only filter the builds by branch, so the status and event are
+        # checked here. Fetch older pages only if the newer ones don't have the build.
+        # The raw data is scanned so that we only build the model of the match.
+        for page in range(1, MAX_BUILD_PAGES + 1):
+            build_history = self._build_history(project_pipeline, page, branch)
+            for build_data in build_history:
+                if (
+                    build_data["status"] == "success"
+                    and build_data["target"] == branch
+                    and build_data["event"] == "push"
+                ):
+                    return BuildInfo.from_kwargs(**build_data)
+            if len(build_history) < BUILDS_PER_PAGE:
+                break
         raise DroneBuildError(
             f"There are no successful jobs with target branch {branch}"
         )
@@ -250,7 +311,7 @@ class Drone:
             f"{self.drone_url}/api/repos/{project_pipeline}/builds/{build_number}/"
             f"promote?target={environment}"
         )
-        response = self.get(promote_url, "post").json()
+        response = loads(self.get(promote_url, "post").content)
         log.info(f"Job #{response['number']} has started.")
 
         return response["number"]
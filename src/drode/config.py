@@ -4,11 +4,20 @@ import logging
 import os
 import shutil
 from collections import UserDict
-from typing import Any, Dict, List, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 
-from ruamel.yaml import YAML
-from ruamel.yaml.parser import ParserError
-from ruamel.yaml.scanner import ScannerError
+import yaml
+
+# Use the libyaml C bindings if they are available, as they are much faster than the
+# pure Python implementation.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from ruamel.yaml import YAML
 
 # NOTE: We can't migrate to maison or goodconf as they only support read only
 # interaction with the configuration, and we need to update it because we save the
@@ -21,12 +30,58 @@ class ConfigError(Exception):
     """Catch configuration errors."""
 
 
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot notation configuration key into it's parts."""
+    return tuple(key.split("."))
+
+
+@lru_cache(maxsize=None)
+def _round_trip_yaml() -> "YAML":
+    """Build the ruamel YAML instance used to save the configuration.
+
+    It's built the first time the configuration is saved, and reused afterwards.
+    """
+    # C0415: import outside toplevel. ruamel is slow to import and only the
+    # commands that change the configuration need it.
+    from ruamel.yaml import YAML  # noqa: C0415
+
+    ruamel_yaml = YAML()
+    ruamel_yaml.default_flow_style = False
+    # The file is loaded with PyYAML, which follows YAML 1.1, so ruamel has to
+    # read and write it with the same rules. Otherwise scalars like yes or on
+    # would be read as strings and written back with a different meaning.
+    # ruamel builds its resolver lazily with the version the instance has at
+    # that moment, and loading a document that starts with --- clears it, so
+    # the resolver is built now. The version is cleared afterwards so that no
+    # %YAML directive is added to the file.
+    ruamel_yaml.version = (1, 1)
+    _ = ruamel_yaml.resolver
+    ruamel_yaml.version = None
+    return ruamel_yaml
+
+
+def _update_document(document: Dict[str, Any], data: Dict[str, Any]) -> None:
+    """Make the round-trip loaded document equal to data, keeping its comments."""
+    for key in list(document):
+        if key not in data:
+            del document[key]
+    for key, value in data.items():
+        if isinstance(value, dict) and isinstance(document.get(key), dict):
+            _update_document(document[key], value)
+        elif key not in document or document[key] != value:
+            document[key] = value
+
+
 # R0901: UserDict has too many ancestors. Right now I don't feel like switching to
 #   another base class, as `dict` won't work straight ahead.
 # type ignore: I haven't found a way to specify the type of the generic UserDict class.
 class Config(UserDict):  # type: ignore # noqa: R0901
     """Expose the configuration in a friendly way.
 
+    The configuration is loaded the first time it's accessed, so the commands that
+    don't use it don't pay the cost.
+
     Public methods:
         get: Fetch the configuration value of the specified key.
         load: Load the configuration from the configuration YAML file.
@@ -41,10 +96,22 @@ class Config(UserDict):  # type: ignore # noqa: R0901
         self,
         config_path: str = "~/.local/share/drode/config.yaml",
     ) -> None:
-        """Configure the attributes and load the configuration."""
+        """Configure the attributes."""
         super().__init__()
         self.config_path = os.path.expanduser(config_path)
-        self.load()
+        self._data: Optional[Dict[str, Any]] = None
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Return the configuration, loading it the first time it's accessed."""
+        if self._data is None:
+            self.load()
+        return cast(Dict[str, Any], self._data)
+
+    @data.setter
+    def data(self, value: Dict[str, Any]) -> None:
+        """Set the configuration."""
+        self._data = value
 
     def get(
         # ANN401: default signature is not trivial, and this code will be deprecated,
@@ -68,10 +135,9 @@ class Config(UserDict):  # type: ignore # noqa: R0901
         self.data.get('first.second') == 'value'
         """
         original_key = key
-        config_keys = key.split(".")
-        value = self.data.copy()
+        value = self.data
 
-        for config_key in config_keys:
+        for config_key in _split_key(key):
             try:
                 value = value[config_key]
             except KeyError as error:
@@ -99,8 +165,7 @@ class Config(UserDict):  # type: ignore # noqa: R0901
 
         self.data.set('first.second', 'value')
         """
-        config_keys: List[str] = key.split(".")
-        last_key = config_keys.pop(-1)
+        *config_keys, last_key = _split_key(key)
 
         # Initialize the dictionary structure
         parent = self.data
@@ -115,23 +180,51 @@ class Config(UserDict):  # type: ignore # noqa: R0901
         parent[last_key] = value
 
     def load(self) -> None:
-        """Load the configuration from the configuration YAML file."""
-        try:
-            with open(self.config_path, "r", encoding="utf-8") as file_cursor:
-                try:
-                    self.data = YAML().load(file_cursor)
-                except (ParserError, ScannerError) as error:
-                    raise ConfigError(str(error)) from error
-        except FileNotFoundError:
+        """Load the configuration from the configuration YAML file.
+
+        If the file doesn't exist, the default configuration is copied and loaded.
+
+        Raises:
+            ConfigError: if the file is not valid YAML.
+        """
+        if not os.path.isfile(self.config_path):
             log.warning(
-                "The configuration file {self.config_path} could not be found."
+                f"The configuration file {self.config_path} could not be found."
                 "\n Copying the default one."
             )
             shutil.copy("assets/config.yaml", self.config_path)
 
+        with open(self.config_path, "r", encoding="utf-8") as file_cursor:
+            try:
+                self.data = yaml.load(file_cursor, Loader=SafeLoader)
+            except yaml.YAMLError as error:
+                raise ConfigError(str(error)) from error
+
     def save(self) -> None:
-        """Save the configuration in the configuration YAML file."""
+        """Save the configuration in the configuration YAML file.
+
+        The file is rewritten with ruamel's round-trip writer, so the comments of the
+        keys that are still in the configuration are preserved. It's read and written
+        following YAML 1.1, the version load reads it with.
+        """
+        # C0415: import outside toplevel. ruamel is slow to import and only the
+        # commands that change the configuration need it.
+        from ruamel.yaml.error import YAMLError  # noqa: C0415
+
+        ruamel_yaml = _round_trip_yaml()
+        # Loading a document with a %YAML directive sets the instance version,
+        # which would add the directive to the next files saved.
+        ruamel_yaml.version = None
+        try:
+            with open(self.config_path, "r", encoding="utf-8") as file_cursor:
+                document = ruamel_yaml.load(file_cursor)
+        except (OSError, YAMLError):
+            document = None
+
+        if isinstance(document, dict):
+            _update_document(document, self.data)
+        else:
+            document = self.data
+
         with open(self.config_path, "w+", encoding="utf-8") as file_cursor:
-            yaml = YAML()
-            yaml.default_flow_style = False
-            yaml.dump(self.data, file_cursor)
+            ruamel_yaml.dump(document, file_cursor)
@@ -10,18 +10,17 @@ import sys
 
 from ..adapters import Drone
 from ..adapters.aws import AWS
-from ..config import Config, ConfigError
+from ..config import Config
 
 log = logging.getLogger(__name__)
 
 
 def load_config(config_path: str) -> Config:
-    """Configure the Config object."""
-    try:
-        return Config(config_path)
-    except ConfigError as error:
-        log.error(str(error))
-        sys.exit(1)
+    """Configure the Config object.
+
+    The configuration file is read the first time a command uses it.
+    """
+    return Config(config_path)
 
 
 def load_drone() -> Drone:
@@ -6,10 +6,10 @@ from typing import Optional
 
 import click
 from click.core import Context
-from ruamel.yaml.parser import ParserError
 
 from .. import services, version, views
-from ..adapters.aws import AWSConfigurationError
+from ..adapters import Drone
+from ..adapters.aws import AWS, AWSConfigurationError
 from ..adapters.drone import DroneBuildError, DroneConfigurationError
 from ..config import ConfigError
 from ..version import __version__
@@ -32,24 +32,46 @@ log = logging.getLogger(__name__)
 def cli(ctx: Context, config_path: str, verbose: bool) -> None:
     """Command line interface main click entrypoint."""
     ctx.ensure_object(dict)
+    ctx.obj["config"] = load_config(config_path)
+    load_logger(verbose)
 
-    try:
-        ctx.obj["config"] = load_config(config_path)
-    except ParserError as error:
-        log.error(error)
-        sys.exit(1)
 
+def _drone(ctx: Context) -> Drone:
+    """Return the Drone adapter, loading it the first time a command needs it."""
     try:
-        ctx.obj["drone"]
+        return ctx.obj["drone"]
     except KeyError:
         ctx.obj["drone"] = load_drone()
+        return ctx.obj["drone"]
+
 
+def _aws(ctx: Context) -> AWS:
+    """Return the AWS adapter, loading it the first time a command needs it."""
     try:
-        ctx.obj["aws"]
+        return ctx.obj["aws"]
     except KeyError:
         ctx.obj["aws"] = load_aws()
+        return ctx.obj["aws"]
 
-    load_logger(verbose)
+
+def _max_wait_delay(ctx: Context) -> float:
+    """Return the maximum seconds between Drone queries while waiting for a build.
+
+    Raises:
+        ConfigError: if the configured value is not a positive number.
+    """
+    max_wait_delay = ctx.obj["config"].get("max_wait_delay", services.MAX_WAIT_DELAY)
+    error_message = (
+        "The max_wait_delay configuration must be a positive number, "
+        f"not {max_wait_delay}"
+    )
+    try:
+        delay = float(max_wait_delay)
+    except (TypeError, ValueError) as error:
+        raise ConfigError(error_message) from error
+    if delay <= 0:
+        raise ConfigError(error_message)
+    return delay
 
 
 @cli.command("set")
@@ -83,7 +105,7 @@ def wait_command(ctx: Context, build_number: Optional[int] = None) -> None:
     try:
         project_id = services.get_active_project(ctx.obj["config"])
         pipeline = ctx.obj["config"]["projects"][project_id]["pipeline"]
-        services.wait(ctx.obj["drone"], pipeline, build_number)
+        services.wait(_drone(ctx), pipeline, build_number, _max_wait_delay(ctx))
     except (DroneBuildError, ConfigError) as error:
         log.error(error)
         sys.exit(1)
@@ -108,11 +130,13 @@ def promote(
         project_id = services.get_active_project(ctx.obj["config"])
         pipeline = ctx.obj["config"]["projects"][project_id]["pipeline"]
         promote_build_number = services.promote(
-            ctx.obj["drone"], pipeline, environment, build_number
+            _drone(ctx), pipeline, environment, build_number
         )
 
         if wait:
-            services.wait(ctx.obj["drone"], project_id, promote_build_number)
+            services.wait(
+                _drone(ctx), project_id, promote_build_number, _max_wait_delay(ctx)
+            )
             print("\a")
     except (DroneBuildError, ConfigError) as error:
         log.error(error)
@@ -125,8 +149,8 @@ def verify(ctx: Context) -> None:
     """Verify that the different integrations are correctly configured."""
     try:
         log.info(f"Drode: {__version__}")
-        ctx.obj["drone"].check_configuration()
-        ctx.obj["aws"].check_configuration()
+        _drone(ctx).check_configuration()
+        _aws(ctx).check_configuration()
     except (AWSConfigurationError, DroneConfigurationError) as error:
         log.error(error)
         sys.exit(1)
@@ -137,7 +161,7 @@ def verify(ctx: Context) -> None:
 def status(ctx: Context) -> None:
     """Print the status of the autoscaling groups of the active project."""
     try:
-        project_status = services.project_status(ctx.obj["config"], ctx.obj["aws"])
+        project_status = services.project_status(ctx.obj["config"], _aws(ctx))
         views.print_status(project_status)
     except ConfigError as error:
         log.error(error)
@@ -167,7 +191,7 @@ def time(
             project_pipeline = pipeline
 
         pipeline_times = services.pipeline_times(
-            project_pipeline, ctx.obj["drone"], number_builds
+            project_pipeline, _drone(ctx), number_builds
         )
         views.print_times(project_pipeline, pipeline_times)
     except ConfigError as error:
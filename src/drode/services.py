@@ -5,20 +5,35 @@ and handlers to achieve the program's purpose.
 """
 
 import logging
+import os
+import random
 import time
 from math import sqrt
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
 
 from .adapters import Drone
 from .adapters.aws import AWS, AutoscalerInfo
-from .adapters.drone import DronePromoteError
+from .adapters.drone import BuildInfo, DronePromoteError
 from .config import Config, ConfigError
 
 log = logging.getLogger(__name__)
 
+# Default maximum number of seconds between queries to Drone while waiting for a build.
+MAX_WAIT_DELAY = 8.0
+_YES: FrozenSet[str] = frozenset({"yes", "y"})
+# Display name and configuration key of the environments shown by project_status.
+_ENVIRONMENTS: Tuple[Tuple[str, str], ...] = (
+    ("Production", "production"),
+    ("Staging", "staging"),
+)
+
 
 def wait(
-    drone: Drone, project_pipeline: str, build_number: Optional[int] = None
+    drone: Drone,
+    project_pipeline: str,
+    build_number: Optional[int] = None,
+    max_delay: float = MAX_WAIT_DELAY,
+    sleep: Callable[[float], None] = time.sleep,
 ) -> bool:
     """Wait for the pipeline build to finish.
 
@@ -26,6 +41,8 @@ def wait(
         project_pipeline: Drone pipeline identifier.
             In the format of `repo_owner/repo_name`.
         build_number: Number of drone build.
+        max_delay: Maximum number of seconds between queries to the Drone server.
+        sleep: Function used to wait between queries to the Drone server.
 
     Returns:
         True: When job has finished.
@@ -34,16 +51,23 @@ def wait(
         DroneBuildError: if the job doesn't exist
         DroneAPIError: if the API returns a job with a "number" that is not an int.
     """
+    build: Optional[BuildInfo] = None
     if build_number is None:
-        last_build = drone.last_build_info(project_pipeline)
-        if last_build.finished != 0:
+        build = drone.last_build_info(project_pipeline)
+        if build.finished != 0:
             log.info("There are no active jobs")
             return True
-        build_number = last_build.number
+        build_number = build.number
 
     first_time = True
+    # Poll often at the start, so short builds are reported quickly, and back off
+    # exponentially to avoid hammering the Drone server on long builds.
+    delay = 0.2
     while True:
-        build = drone.build_info(project_pipeline, build_number)
+        # Reuse the last build information on the first iteration if we already have
+        # it.
+        if build is None:
+            build = drone.build_info(project_pipeline, build_number)
 
         if build.finished == 0:
             if first_time:
@@ -52,7 +76,11 @@ def wait(
                     f"a {build.event} event by {build.trigger}."
                 )
                 first_time = False
-            time.sleep(1)
+            # S311: random is not used for security purposes, just to spread the
+            # queries of different clients.
+            sleep(delay * random.uniform(1, 1.1))  # noqa: S311
+            delay = min(delay * 2, max_delay)
+            build = None
             continue
         log.info(f"Job #{build.number} has finished with status {build.status}")
         return True
@@ -64,7 +92,7 @@ def _check_project(config: Config, project_id: str) -> None:
     Raises:
         ConfigError: if project doesn't exist
     """
-    if project_id not in config["projects"].keys():
+    if project_id not in config["projects"]:
         raise ConfigError(f"The project {project_id} does not exist")
 
 
@@ -85,14 +113,15 @@ def get_active_project(config: Config) -> str:
         return config["active_project"]
     except KeyError as error:
         try:
-            if len(config["projects"].keys()) == 1:
-                return [key for key, value in config["projects"].items()][0]
+            projects = config["projects"]
+            if len(projects) == 1:
+                return next(iter(projects))
             raise ConfigError(
                 "There are more than one project configured but none "
                 "is marked as active. Please use drode set command to "
                 "define one."
             ) from error
-        except (KeyError, AttributeError):
+        except (KeyError, TypeError):
             raise ConfigError("There are no projects configured.") from error
 
 
@@ -111,13 +140,21 @@ def set_active_project(config: Config, project_id: str) -> None:
 def ask(question: str) -> bool:
     """Prompt the user to answer yes or no to a question.
 
+    If the DRODE_ASSUME_YES environmental variable is set, the question is answered
+    with yes without prompting the user, so drode can be used unattended. If the
+    standard input is closed before the user answers, the answer is no.
+
     Returns:
         answer: User's answer
     """
-    answer = input(question)
-    if answer in ["yes", "y"]:
+    if os.environ.get("DRODE_ASSUME_YES", "") not in ("", "0"):
+        log.info(f"{question}yes (DRODE_ASSUME_YES is set)")
         return True
-    return False
+    try:
+        answer = input(question)
+    except EOFError:
+        return False
+    return answer.strip().lower() in _YES
 
 
 def promote(
@@ -175,20 +212,31 @@ def project_status(config: Config, aws: AWS) -> ProjectStatus:
     """
     project: ProjectStatus = {}
     active_project = get_active_project(config)
+    try:
+        autoscaling_groups = config.get(
+            f"projects.{active_project}.aws.autoscaling_groups"
+        )
+    except ConfigError:
+        autoscaling_groups = {}
+    if not isinstance(autoscaling_groups, dict):
+        autoscaling_groups = {}
+
+    autoscaler_names: Dict[str, str] = {}
+    for environment, environment_key in _ENVIRONMENTS:
+        autoscaler_name = autoscaling_groups.get(environment_key)
+        if isinstance(autoscaler_name, str):
+            autoscaler_names[environment] = autoscaler_name
+
+    # Fetch the autoscaling groups of all the environments in one query.
+    autoscaler_infos = aws.get_autoscaling_groups(
+        list(dict.fromkeys(autoscaler_names.values()))
+    )
 
-    for environment in ["Production", "Staging"]:
-        try:
-            autoscaler_name = config.get(
-                f"projects.{active_project}."
-                f"aws.autoscaling_groups.{environment.lower()}"
-            )
-            if not isinstance(autoscaler_name, str):
-                raise ConfigError("The autoscaler name is not a string")
-            autoscaler_info = aws.get_autoscaling_group(autoscaler_name)
-        except ConfigError:
-            autoscaler_info = AutoscalerInfo()
-
-        project[environment] = autoscaler_info
+    for environment, _ in _ENVIRONMENTS:
+        if environment in autoscaler_names:
+            project[environment] = autoscaler_infos[autoscaler_names[environment]]
+        else:
+            project[environment] = AutoscalerInfo()
 
     return project
 
@@ -10,11 +10,9 @@ __version__ = "1.3.0"
 
 def version_info() -> str:
     """Display the version of the program, python and the platform."""
-    return dedent(
-        f"""\
+    return dedent(f"""\
         ------------------------------------------------------------------
              drode: {__version__}
              Python: {sys.version.split(" ", maxsplit=1)[0]}
              Platform: {platform.platform()}
-        ------------------------------------------------------------------"""
-    )
+        ------------------------------------------------------------------""")
@@ -2,8 +2,6 @@
 
 from typing import TYPE_CHECKING
 
-import tabulate
-
 if TYPE_CHECKING:
     from drode.adapters.aws import AutoscalerInfo
     from drode.services import PipelineTimes, ProjectStatus
@@ -11,10 +9,12 @@ if TYPE_CHECKING:
 
 def print_autoscaling_group_info(autoscaler_info: "AutoscalerInfo") -> None:
     """Print the information of the autoscaler information in table format."""
+    # C0415: import outside toplevel. tabulate is slow to import and only the
+    # status commands print tables.
+    from tabulate import tabulate  # noqa: C0415
+
     print(f"Active Template: {autoscaler_info.template}")
-    print(
-        tabulate.tabulate(autoscaler_info.instances, headers="keys", tablefmt="simple")
-    )
+    print(tabulate(autoscaler_info.instances, headers="keys", tablefmt="simple"))
 
 
 def print_status(project_status: "ProjectStatus") -> None:
@@ -37,11 +37,12 @@ def print_times(pipeline_name: str, pipeline_times: "PipelineTimes") -> None:
     print(f"Standard deviation time: {_print_time(standard_deviation)}")
 
 
-def _print_time(time: float) -> str:
+def _print_time(seconds: float) -> str:
     """Print the time with a nice format.
 
     Examples:
     >>> _print_time(63.1)
     "01:03"
     """
-    return f"{round(time)//60:02}:{round(time)%60:02}"
+    minutes, remaining = divmod(round(seconds), 60)
+    return f"{minutes:02}:{remaining:02}"
@@ -1,10 +1,12 @@
 """Store the classes and fixtures used throughout the tests."""
 
 import os
+from copy import deepcopy
 from pathlib import Path
-from shutil import copyfile
+from typing import Any, Dict
 
 import pytest
+import yaml
 
 from drode.config import Config
 
@@ -14,25 +16,63 @@ os.environ["DRONE_SERVER"] = "https://drone.url"
 os.environ["DRONE_TOKEN"] = "drone_token"
 
 
-@pytest.fixture(name="config")
-def fixture_config(tmp_path: Path) -> Config:
-    """Configure the Config object for the tests."""
+@pytest.fixture(name="config_template", scope="session")
+def config_template_() -> bytes:
+    """Read the content of the tests configuration file once per session."""
+    return Path("tests/assets/config.yaml").read_bytes()
+
+
+@pytest.fixture(name="config_data", scope="session")
+def config_data_(config_template: bytes) -> Dict[str, Any]:
+    """Parse the tests configuration file once per session."""
+    return yaml.safe_load(config_template)
+
+
+@pytest.fixture(name="config_file")
+def config_file_(tmp_path: Path, config_template: bytes) -> str:
+    """Write the tests configuration file in the temporal directory."""
     data = tmp_path / "data"
     data.mkdir()
     config_file = data / "config.yaml"
-    copyfile("tests/assets/config.yaml", config_file)
-    config = Config(str(config_file))
+    config_file.write_bytes(config_template)
+
+    return str(config_file)
+
+
+@pytest.fixture(name="config")
+def fixture_config(config_file: str, config_data: Dict[str, Any]) -> Config:
+    """Configure the Config object for the tests.
+
+    The data is copied from the parsed template instead of loading the file. The
+    file is still written for the code that reads it or saves the configuration.
+    """
+    config = Config(config_file)
+    config.data = deepcopy(config_data)
 
     return config
 
 
+@pytest.fixture(name="session_drone", scope="session")
+def session_drone_() -> FakeDrone:
+    """Build the FakeDrone object shared by the tests of the session."""
+    return FakeDrone("https://drone.url", "drone_token")
+
+
 @pytest.fixture(name="drone")
-def fake_drone_() -> FakeDrone:
+def fake_drone_(session_drone: FakeDrone) -> FakeDrone:
     """Prepare the FakeDrone object to test."""
-    return FakeDrone("https://drone.url", "drone_token")
+    session_drone.reset()
+    return session_drone
+
+
+@pytest.fixture(name="session_aws", scope="session")
+def session_aws_() -> FakeAWS:
+    """Build the FakeAWS object shared by the tests of the session."""
+    return FakeAWS()
 
 
 @pytest.fixture(name="aws")
-def aws_() -> FakeAWS:
+def aws_(session_aws: FakeAWS) -> FakeAWS:
     """Configure the FakeAWS adapter."""
-    return FakeAWS()
+    session_aws.reset()
+    return session_aws
@@ -3,8 +3,10 @@
 import logging
 import os
 import re
+import subprocess  # noqa: S404
+import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple, Union
 from unittest.mock import patch
 
 import pytest
@@ -20,14 +22,55 @@ from ..factories import BuildInfoFactory
 
 FakeDeps = Dict[str, Any]
 
+_VERSION_RE = re.compile(
+    rf" *drode: {re.escape(__version__)}\n" r" *Python: .*\n *Platform: .*"
+)
+
+# Log records of the verify command.
+_DRODE_VERSION = ("drode.entrypoints.cli", logging.INFO, f"Drode: {__version__}")
+_DRONE_OK = ("tests.fake_adapters", logging.INFO, "Drone: OK")
+_DRONE_KO = ("tests.fake_adapters", logging.ERROR, "Drone: KO")
+_AWS_OK = ("tests.fake_adapters", logging.INFO, "AWS: OK")
+_AWS_KO = ("tests.fake_adapters", logging.ERROR, "AWS: KO")
+_VERIFY_LOGS = frozenset((_DRODE_VERSION, _DRONE_OK, _DRONE_KO, _AWS_OK, _AWS_KO))
+
+# The builds are never modified, so they can be shared between tests. The lists
+# passed to set_builds can't, as FakeDrone appends the promote jobs to them.
+_BUILD_208 = BuildInfoFactory.build(
+    number=208,
+    finished=1,
+    target="master",
+    status="success",
+    after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
+    message="updated README",
+    event="push",
+)
+_BUILD_596 = BuildInfoFactory.build(
+    number=596,
+    target="master",
+    status="success",
+    started=1669045653,
+    finished=1669046073,
+    after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
+    message="updated README",
+    event="push",
+)
+_BUILD_612 = BuildInfoFactory.build(
+    number=612,
+    target="master",
+    status="success",
+    started=1669212776,
+    finished=1669213278,
+    after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
+    message="updated README",
+    event="push",
+)
+
 
 @pytest.fixture(name="fake_dependencies")
-def fake_dependencies_() -> FakeDeps:
+def fake_dependencies_(drone: FakeDrone, aws: FakeAWS) -> FakeDeps:
     """Configure the injection of fake dependencies."""
-    return {
-        "drone": FakeDrone("https://drone.url", "drone_token"),
-        "aws": FakeAWS(),
-    }
+    return {"drone": drone, "aws": aws}
 
 
 @pytest.fixture(name="runner")
@@ -48,33 +91,51 @@ def test_version(runner: CliRunner) -> None:
     result = runner.invoke(cli, ["--version"])
 
     assert result.exit_code == 0
-    assert re.search(
-        rf" *drode: {__version__}\n" r" *Python: .*\n *Platform: .*",
-        result.stdout,
+    assert _VERSION_RE.search(result.stdout)
+
+
+def test_cli_import_doesnt_load_slow_libraries() -> None:
+    """
+    Given: Nothing
+    When: The command line module is imported, for example for shell completion.
+    Then: The slow to import boto3, botocore and tabulate libraries are not loaded.
+    """
+    command = (
+        "import sys, drode.entrypoints.cli; "
+        "print(any(module in sys.modules for module in "
+        "('boto3', 'botocore', 'tabulate')))"
     )
 
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", command], capture_output=True, check=True, text=True
+    )
+
+    assert result.stdout == "False\n"
+
 
 def test_load_config_handles_configerror_exceptions(
     runner: CliRunner, tmp_path: Path, caplog: LogCaptureFixture
 ) -> None:
     """
     Given: A wrong configuration file.
-    When: CLI is initialized
+    When: A command that uses the configuration is run.
     Then: The ConfigError exception is gracefully handled.
     """
     config_file = tmp_path / "config.yaml"
     config_file.write_text("[ invalid yaml")
 
-    result = runner.invoke(cli, ["-c", str(config_file), "null"])
+    result = runner.invoke(cli, ["-c", str(config_file), "active"])
 
     assert result.exit_code == 1
-    assert (
-        "drode.entrypoints",
-        logging.ERROR,
-        f'while parsing a flow sequence\n  in "{config_file}", '
-        "line 1, column 1\nexpected ',' or ']', but got '<stream end>'\n  in"
-        f' "{config_file}", line 1, column 15',
-    ) in caplog.record_tuples
+    error_messages = [
+        message
+        for logger, level, message in caplog.record_tuples
+        if (logger, level) == ("drode.entrypoints.cli", logging.ERROR)
+    ]
+    # The rest of the message depends on whether libyaml is installed.
+    assert error_messages[0].startswith(
+        f'while parsing a flow sequence\n  in "{config_file}", line 1, column 1\n'
+    )
 
 
 def test_load_config_creates_default_file_if_it_doesnt_exist(
@@ -82,14 +143,19 @@ def test_load_config_creates_default_file_if_it_doesnt_exist(
 ) -> None:
     """
     Given: A missing configuration file.
-    When: CLI is initialized
-    Then: The file is created and the commandline ends well.
+    When: A command that uses the configuration is run.
+    Then: The default file is created and loaded.
     """
     os.remove(config.config_path)
 
-    result = runner.invoke(cli, ["null"])
+    result = runner.invoke(cli, ["active"])
 
-    assert result.exit_code == 0
+    assert result.exit_code == 1
+    assert (
+        "drode.entrypoints.cli",
+        logging.ERROR,
+        "There are no projects configured.",
+    ) in caplog.record_tuples
     with open("assets/config.yaml", "r", encoding="utf-8") as file_descriptor:
         default_config = file_descriptor.read()
     with open(config.config_path, "r", encoding="utf-8") as file_descriptor:
@@ -97,6 +163,22 @@ def test_load_config_creates_default_file_if_it_doesnt_exist(
     assert created_config == default_config
 
 
+def test_commands_that_dont_use_the_configuration_dont_load_it(
+    runner: CliRunner, tmp_path: Path
+) -> None:
+    """
+    Given: A wrong configuration file.
+    When: A command that doesn't use the configuration is run.
+    Then: The configuration is not loaded, so the command ends well.
+    """
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("[ invalid yaml")
+
+    result = runner.invoke(cli, ["-c", str(config_file), "null"])
+
+    assert result.exit_code == 0
+
+
 def test_set_active_project_happy_path(
     runner: CliRunner, caplog: LogCaptureFixture
 ) -> None:
@@ -245,15 +327,42 @@ def test_wait_subcommand_handles_unhappy_path(
     ) in caplog.record_tuples
 
 
+@pytest.mark.parametrize("max_wait_delay", ["fast", 0, -1])
+def test_wait_subcommand_handles_invalid_max_wait_delay(
+    runner: CliRunner,
+    caplog: LogCaptureFixture,
+    fake_dependencies: FakeDeps,
+    config: Config,
+    max_wait_delay: Union[str, int],
+) -> None:
+    """
+    Given: A configuration whose max_wait_delay is not a positive number.
+    When: The wait subcommand is called.
+    Then: The error is handled gracefully.
+    """
+    config.set("max_wait_delay", max_wait_delay)
+    config.save()
+
+    result = runner.invoke(cli, ["wait"], obj=fake_dependencies)
+
+    assert result.exit_code == 1
+    assert (
+        "drode.entrypoints.cli",
+        logging.ERROR,
+        "The max_wait_delay configuration must be a positive number, "
+        f"not {max_wait_delay}",
+    ) in caplog.record_tuples
+
+
 def test_load_drone_handles_wrong_drone_credentials(
-    config: Config, caplog: LogCaptureFixture
+    config: Config, caplog: LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """
     Given: A user environment without the required drone environmental variables.
-    When: Trying to load the Drone object
+    When: Running a command that needs the Drone object
     Then: The user is informed of the issue and the program exits.
     """
-    del os.environ["DRONE_TOKEN"]
+    monkeypatch.delenv("DRONE_TOKEN")
     runner = CliRunner(
         mix_stderr=False,
         env={
@@ -262,7 +371,7 @@ def test_load_drone_handles_wrong_drone_credentials(
         },
     )
 
-    result = runner.invoke(cli, ["null"])
+    result = runner.invoke(cli, ["verify"])
 
     assert result.exit_code == 1
     assert (
@@ -272,6 +381,23 @@ def test_load_drone_handles_wrong_drone_credentials(
     ) in caplog.record_tuples
 
 
+def test_active_project_doesnt_need_drone_credentials(config: Config) -> None:
+    """
+    Given: A user environment without the drone environmental variables.
+    When: The active subcommand is called.
+    Then: The active project is returned as the Drone object is not loaded.
+    """
+    runner = CliRunner(
+        mix_stderr=False,
+        env={"DRODE_CONFIG_PATH": config.config_path, "DRONE_TOKEN": None},
+    )
+
+    result = runner.invoke(cli, ["active"])
+
+    assert result.exit_code == 0
+    assert "test_project_1" in result.stdout
+
+
 def test_promote_happy_path(
     runner: CliRunner, caplog: LogCaptureFixture, fake_dependencies: FakeDeps
 ) -> None:
@@ -280,28 +406,7 @@ def test_promote_happy_path(
     When: The promote subcommand is called on that build.
     Then: The build is promoted.
     """
-    fake_dependencies["drone"].set_builds(
-        [
-            BuildInfoFactory.build(
-                number=208,
-                finished=1,
-                target="master",
-                status="success",
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-                event="push",
-            ),
-            BuildInfoFactory.build(
-                number=208,
-                finished=1,
-                target="master",
-                status="success",
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-                event="push",
-            ),
-        ],
-    )
+    fake_dependencies["drone"].set_builds([_BUILD_208, _BUILD_208])
     with patch("drode.services.ask", return_value=True):
         # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
 
@@ -330,28 +435,7 @@ def test_promote_happy_path_with_wait_flag(
     When: The promote subcommand is called on that build with the wait flag.
     Then: The build is promoted and then we wait for it to finish.
     """
-    fake_dependencies["drone"].set_builds(
-        [
-            BuildInfoFactory.build(
-                number=208,
-                finished=1,
-                target="master",
-                status="success",
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-                event="push",
-            ),
-            BuildInfoFactory.build(
-                number=208,
-                finished=1,
-                target="master",
-                status="success",
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-                event="push",
-            ),
-        ],
-    )
+    fake_dependencies["drone"].set_builds([_BUILD_208, _BUILD_208])
     with patch("drode.services.ask", return_value=True):
         # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
 
@@ -387,67 +471,37 @@ def test_promote_unhappy_path(
     ) in caplog.record_tuples
 
 
-def test_verify_happy_path(
-    runner: CliRunner, caplog: LogCaptureFixture, fake_dependencies: FakeDeps
-) -> None:
-    """
-    Given: A Drone and AWS correct configurations.
-    When: The verify command is called
-    Then: The user is informed of the correct configuration.
-    """
-    result = runner.invoke(cli, ["verify"], obj=fake_dependencies)
-
-    assert result.exit_code == 0
-    expected_calls = [
-        ("drode.entrypoints.cli", logging.INFO, f"Drode: {__version__}"),
-        ("tests.fake_adapters", logging.INFO, "Drone: OK"),
-        ("tests.fake_adapters", logging.INFO, "AWS: OK"),
-    ]
-    for expected_call in expected_calls:
-        assert expected_call in caplog.record_tuples
-
-
-def test_verify_fails_gracefully_on_drone_error(
-    runner: CliRunner, caplog: LogCaptureFixture, fake_dependencies: FakeDeps
-) -> None:
-    """
-    Given: A wrong Drone and AWS correct configurations.
-    When: The verify command is called
-    Then: The Drone exception is handled gracefully
-    """
-    fake_dependencies["drone"].correct_config = False
-
-    result = runner.invoke(cli, ["verify"], obj=fake_dependencies)
-
-    assert result.exit_code == 1
-    expected_calls = [
-        ("drode.entrypoints.cli", logging.INFO, f"Drode: {__version__}"),
-        ("tests.fake_adapters", logging.ERROR, "Drone: KO"),
-    ]
-    for expected_call in expected_calls:
-        assert expected_call in caplog.record_tuples
-
-
-def test_verify_fails_gracefully_on_aws_error(
-    runner: CliRunner, caplog: LogCaptureFixture, fake_dependencies: FakeDeps
+@pytest.mark.parametrize(
+    ("broken_adapter", "exit_code", "expected_logs"),
+    [
+        (None, 0, [_DRODE_VERSION, _DRONE_OK, _AWS_OK]),
+        ("drone", 1, [_DRODE_VERSION, _DRONE_KO]),
+        ("aws", 1, [_DRODE_VERSION, _DRONE_OK, _AWS_KO]),
+    ],
+    ids=["happy_path", "drone_error", "aws_error"],
+)
+def test_verify(
+    runner: CliRunner,
+    caplog: LogCaptureFixture,
+    fake_dependencies: FakeDeps,
+    broken_adapter: Optional[str],
+    exit_code: int,
+    expected_logs: List[Tuple[str, int, str]],
 ) -> None:
     """
-    Given: A wrong Drone and AWS correct configurations.
+    Given: A Drone and AWS configurations, where at most one of them is wrong.
     When: The verify command is called
-    Then: The Drone exception is handled gracefully
+    Then: The user is informed of the state of each configuration in order, the
+        checks stop at the first error, and the errors are handled gracefully.
     """
-    fake_dependencies["aws"].correct_config = False
+    if broken_adapter is not None:
+        fake_dependencies[broken_adapter].correct_config = False
 
     result = runner.invoke(cli, ["verify"], obj=fake_dependencies)
 
-    assert result.exit_code == 1
-    expected_calls = [
-        ("drode.entrypoints.cli", logging.INFO, f"Drode: {__version__}"),
-        ("tests.fake_adapters", logging.INFO, "Drone: OK"),
-        ("tests.fake_adapters", logging.ERROR, "AWS: KO"),
-    ]
-    for expected_call in expected_calls:
-        assert expected_call in caplog.record_tuples
+    assert result.exit_code == exit_code
+    verify_logs = [record for record in caplog.record_tuples if record in _VERIFY_LOGS]
+    assert verify_logs == expected_logs
 
 
 def test_status_happy_path(runner: CliRunner, fake_dependencies: FakeDeps) -> None:
@@ -497,30 +551,7 @@ def test_time_happy_path(
     When: The time subcommand is called.
     Then: The mean and standard error of the build times is returned.
     """
-    fake_dependencies["drone"].set_builds(
-        [
-            BuildInfoFactory.build(
-                number=596,
-                target="master",
-                status="success",
-                started=1669045653,
-                finished=1669046073,
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-                event="push",
-            ),
-            BuildInfoFactory.build(
-                number=612,
-                target="master",
-                status="success",
-                started=1669212776,
-                finished=1669213278,
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-                event="push",
-            ),
-        ],
-    )
+    fake_dependencies["drone"].set_builds([_BUILD_596, _BUILD_612])
     with patch("drode.services.ask", return_value=True):
         # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
 
@@ -543,30 +574,7 @@ def test_time_limit_number_jobs(
     When: The time subcommand is called with a limit in number of jobs
     Then: The mean and standard error of the build times is returned.
     """
-    fake_dependencies["drone"].set_builds(
-        [
-            BuildInfoFactory.build(
-                number=612,
-                target="master",
-                status="success",
-                started=1669212776,
-                finished=1669213278,
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-                event="push",
-            ),
-            BuildInfoFactory.build(
-                number=596,
-                target="master",
-                status="success",
-                started=1669045653,
-                finished=1669046073,
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-                event="push",
-            ),
-        ],
-    )
+    fake_dependencies["drone"].set_builds([_BUILD_612, _BUILD_596])
     with patch("drode.services.ask", return_value=True):
         # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
 
@@ -589,30 +597,7 @@ def test_time_specified_pipeline(
     When: The time subcommand is called with a specific pipeline.
     Then: The mean and standard error of the build times is returned.
     """
-    fake_dependencies["drone"].set_builds(
-        [
-            BuildInfoFactory.build(
-                number=596,
-                target="master",
-                status="success",
-                started=1669045653,
-                finished=1669046073,
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-                event="push",
-            ),
-            BuildInfoFactory.build(
-                number=612,
-                target="master",
-                status="success",
-                started=1669212776,
-                finished=1669213278,
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-                event="push",
-            ),
-        ],
-    )
+    fake_dependencies["drone"].set_builds([_BUILD_596, _BUILD_612])
     with patch("drode.services.ask", return_value=True):
         # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
 
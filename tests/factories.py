@@ -1,6 +1,6 @@
 """Define the factories of the program."""
 
-from typing import Any
+from typing import Any, Dict
 
 from pydantic_factories import ModelFactory
 
@@ -11,3 +11,29 @@ class BuildInfoFactory(ModelFactory[Any]):
     """Define factory for the BuildInfo model."""
 
     __model__ = BuildInfo
+
+
+# Values of the required BuildInfo fields used by make_build_info.
+_BUILD_INFO_DEFAULTS: Dict[str, Any] = {
+    "id": 1,
+    "status": "success",
+    "number": 1,
+    "trigger": "@hook",
+    "event": "push",
+    "message": "commit message",
+    "source": "master",
+    "after": "9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
+    "target": "master",
+    "started": 1591128214,
+    "finished": 1591128225,
+}
+
+
+# ANN401: kwargs are the BuildInfo attributes, which have different types.
+def make_build_info(**kwargs: Any) -> BuildInfo:  # noqa: ANN401
+    """Build a BuildInfo with fixed defaults for the attributes not in kwargs.
+
+    It's much faster than BuildInfoFactory.build, use it when the test doesn't need
+    random values.
+    """
+    return BuildInfo(**{**_BUILD_INFO_DEFAULTS, **kwargs})
@@ -1,7 +1,9 @@
 """Gather the Fake adapters for the e2e tests."""
 
 import logging
-from typing import List
+from collections import deque
+from dataclasses import replace
+from typing import Deque, Dict, List, Optional
 
 from drode.adapters.aws import AWS, AutoscalerInfo, AWSConfigurationError
 from drode.adapters.drone import (
@@ -15,6 +17,24 @@ from .factories import BuildInfoFactory
 
 log = logging.getLogger(__name__)
 
+# Build created by FakeDrone.promote, only the number changes between jobs.
+_PROMOTE_JOB_TEMPLATE = BuildInfoFactory.build()
+
+# The tests don't modify the returned autoscaling group information, so all the
+# FakeAWS calls return the same object.
+_FAKE_AUTOSCALER = AutoscalerInfo(
+    template="launch-config-name",
+    instances=[
+        {
+            "Instance": "i-xxxxxxxxxxxxxxxxx",
+            "IP": "192.168.1.13",
+            "Status": "Healthy/InService",
+            "Created": "2020-06-08T11:29",
+            "Template": "old-launch-config-name",
+        }
+    ],
+)
+
 
 class FakeDrone(Drone):
     """Fake implementation of the Drone adapter."""
@@ -22,8 +42,14 @@ class FakeDrone(Drone):
     def __init__(self, drone_url: str, drone_token: str) -> None:
         """Configure the connection details."""
         super().__init__(drone_url, drone_token)
+        self.reset()
+
+    def reset(self) -> None:
+        """Remove the builds and configuration errors set by the tests."""
         self._builds: List[BuildInfo] = []
-        self._build_infos: List[BuildInfo] = []
+        self._build_infos: Deque[BuildInfo] = deque()
+        self._builds_by_number: Dict[int, BuildInfo] = {}
+        self._success_builds_by_branch: Dict[str, BuildInfo] = {}
         self.correct_config = True
 
     def check_configuration(self) -> None:
@@ -58,19 +84,50 @@ class FakeDrone(Drone):
                 ]
         """
         self._builds = builds
+        self._index_builds()
 
-    def builds(self, project_pipeline: str) -> List[BuildInfo]:
+    def builds(
+        self, project_pipeline: str, page: int = 1, branch: Optional[str] = None
+    ) -> List[BuildInfo]:
         """Return the builds of a project pipeline.
 
+        All the builds set by the tests are returned in the first page.
+
         Args:
             project_pipeline: Drone pipeline identifier.
                 In the format of `repo_owner/repo_name`.
+            page: Page of the build history to fetch.
+            branch: If set, return only the builds of that branch.
 
         Returns:
-            info: all builds information.
+            info: builds information of the page.
         """
+        if page > 1:
+            return []
+        if branch is not None:
+            return [build for build in self._builds if build.target == branch]
         return self._builds
 
+    def last_success_build_info(
+        self, project_pipeline: str, branch: str = "master"
+    ) -> BuildInfo:
+        """Return the information of the last successful build.
+
+        Args:
+            project_pipeline: Drone pipeline identifier.
+                In the format of `repo_owner/repo_name`.
+            branch: Branch to search the last build.
+
+        Returns:
+            info: last successful build number information.
+        """
+        try:
+            return self._success_builds_by_branch[branch]
+        except KeyError as error:
+            raise DroneBuildError(
+                f"There are no successful jobs with target branch {branch}"
+            ) from error
+
     def set_build_infos(self, builds: List[BuildInfo]) -> None:
         """Set the build info expected by the tests.
 
@@ -86,8 +143,25 @@ class FakeDrone(Drone):
                     BuildInfo("number": 209, "finished": 1591129124),
                 ]
         """
-        self._build_infos = builds
+        self._build_infos = deque(builds)
         self._builds = builds
+        self._index_builds()
+
+    def _index_builds(self) -> None:
+        """Index the builds by their number and the successful push builds by branch.
+
+        If there are many builds with the same key, the first one is indexed.
+        """
+        self._builds_by_number = {}
+        self._success_builds_by_branch = {}
+        for build in self._builds:
+            self._index_build(build)
+
+    def _index_build(self, build: BuildInfo) -> None:
+        """Add a build to the indexes unless there is already a build with its key."""
+        self._builds_by_number.setdefault(build.number, build)
+        if build.status == "success" and build.event == "push":
+            self._success_builds_by_branch.setdefault(build.target, build)
 
     def build_info(self, project_pipeline: str, build_number: int) -> BuildInfo:
         """Return the information of the build.
@@ -101,10 +175,10 @@ class FakeDrone(Drone):
             info: build information.
         """
         if self._build_infos:
-            return self._build_infos.pop(0)
+            return self._build_infos.popleft()
         try:
-            return [build for build in self._builds if build.number == build_number][0]
-        except IndexError as error:
+            return self._builds_by_number[build_number]
+        except KeyError as error:
             raise DroneBuildError(
                 f"The build {build_number} was not found at "
                 f"the pipeline {project_pipeline}"
@@ -130,7 +204,9 @@ class FakeDrone(Drone):
             raise ValueError("You don't have defined correctly the build number")
 
         new_build_number = last_build.number + 1
-        self._builds.append(BuildInfoFactory.build(number=new_build_number))
+        new_build = replace(_PROMOTE_JOB_TEMPLATE, number=new_build_number)
+        self._builds.append(new_build)
+        self._index_build(new_build)
 
         return new_build_number
 
@@ -141,11 +217,13 @@ class FakeAWS(AWS):
     def __init__(self) -> None:
         """Configure the connection details."""
         super().__init__()
+        self.reset()
+
+    def reset(self) -> None:
+        """Remove the configuration errors set by the tests."""
         self.correct_config = True
 
-    # ignore and W0221: The parent is a static method, but we need the self here.
-    #   As it's for testing there is no problem breaking the Liskov principle.
-    def check_configuration(self) -> None:  # type: ignore # noqa: W0221
+    def check_configuration(self) -> None:
         """Check if the client is able to interact with the AWS server.
 
         Makes sure that the AWS is correctly configured.
@@ -158,8 +236,24 @@ class FakeAWS(AWS):
             raise AWSConfigurationError()
         log.info("AWS: OK")
 
-    @staticmethod
-    def get_autoscaling_group(autoscaling_name: str) -> AutoscalerInfo:
+    def get_autoscaling_groups(
+        self, autoscaling_names: List[str]
+    ) -> Dict[str, AutoscalerInfo]:
+        """Get information of several autoscaling groups and associated resources.
+
+        Args:
+            autoscaling_names: Autoscaling group names.
+
+        Returns:
+            autoscaler_infos: Information of each autoscaling group indexed by it's
+                name.
+        """
+        return {
+            autoscaling_name: self.get_autoscaling_group(autoscaling_name)
+            for autoscaling_name in autoscaling_names
+        }
+
+    def get_autoscaling_group(self, autoscaling_name: str) -> AutoscalerInfo:
         """Get information of the autoscaling group and associated resources.
 
         Args:
@@ -183,15 +277,4 @@ class FakeAWS(AWS):
         Raises:
             AWSStateError: If no autoscaling groups are found with that name.
         """
-        return AutoscalerInfo(
-            template="launch-config-name",
-            instances=[
-                {
-                    "Instance": "i-xxxxxxxxxxxxxxxxx",
-                    "IP": "192.168.1.13",
-                    "Status": "Healthy/InService",
-                    "Created": "2020-06-08T11:29",
-                    "Template": "old-launch-config-name",
-                }
-            ],
-        )
+        return _FAKE_AUTOSCALER
@@ -0,0 +1,9 @@
+"""Store the fixtures used by the adapter tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry the failed Drone requests without waiting between attempts."""
+    monkeypatch.setattr("drode.adapters.drone.RETRY_DELAY", 0)
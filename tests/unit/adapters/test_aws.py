@@ -2,7 +2,8 @@
 
 import datetime
 import logging
-from typing import Generator
+from collections import defaultdict
+from typing import Dict, Generator
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,18 +12,158 @@ from botocore.exceptions import NoRegionError
 
 from drode.adapters.aws import AWS, AutoscalerInfo, AWSConfigurationError, AWSStateError
 
+# The boto responses are never modified by the adapter, so they're shared between
+# the tests.
+# Autoscaling group attributes that don't change between the tests.
+_BASE_ASG = {
+    "AutoScalingGroupARN": "autoscaling_arn",
+    "AutoScalingGroupName": "production_autoscaling_group_name",
+    "AvailabilityZones": ["us-west-1a", "us-west-1b", "us-west-1c"],
+    "CreatedTime": datetime.datetime(2020, 5, 19, 16, 8, 26, 535000),
+    "DefaultCooldown": 300,
+    "DesiredCapacity": 2,
+    "EnabledMetrics": [],
+    "HealthCheckGracePeriod": 300,
+    "HealthCheckType": "ELB",
+    "LoadBalancerNames": [],
+    "MaxSize": 10,
+    "MinSize": 2,
+    "NewInstancesProtectedFromScaleIn": False,
+    "ServiceLinkedRoleARN": "servicelinkedrolearn",
+    "SuspendedProcesses": [],
+    "TargetGroupARNs": ["target_group_arn"],
+    "TerminationPolicies": ["Default"],
+}
 
-@pytest.fixture(name="boto")
-def boto_() -> Generator[Mock, None, None]:
-    """Prepare the boto mock."""
-    boto_patch = patch("drode.adapters.aws.boto3", autospec=True)
-    boto = boto_patch.start()
+_ASG_PAGE_LAUNCH_CONFIG = {
+    "AutoScalingGroups": [
+        {
+            **_BASE_ASG,
+            "Instances": [
+                {
+                    "AvailabilityZone": "us-west-1d",
+                    "HealthStatus": "Healthy",
+                    "InstanceId": "i-xxxxxxxxxxxxxxxxx",
+                    "LaunchConfigurationName": "old-launch-config-name",
+                    "LifecycleState": "InService",
+                    "ProtectedFromScaleIn": False,
+                },
+            ],
+            "LaunchConfigurationName": "launch-config-name",
+        }
+    ],
+    "ResponseMetadata": {"HTTPStatusCode": 200},
+}
+
+# ECE001: Expression is too complex (7.5 > 7). It's the way the API is defined.
+_DESCRIBE_INSTANCES_PAGE = {  # noqa: ECE001
+    "Reservations": [
+        {
+            "Groups": [],
+            "Instances": [
+                {
+                    "InstanceId": "i-xxxxxxxxxxxxxxxxx",
+                    "InstanceType": "t2.medium",
+                    "LaunchTime": datetime.datetime(2020, 6, 8, 11, 29, 27),
+                    "PrivateIpAddress": "192.168.1.13",
+                    "State": {"Code": 16, "Name": "running"},
+                }
+            ],
+        }
+    ],
+    "ResponseMetadata": {"HTTPStatusCode": 200},
+}
+
+_ASG_PAGE_WITHOUT_INSTANCES = {
+    "AutoScalingGroups": [
+        {
+            "AutoScalingGroupName": "production_autoscaling_group_name",
+            "Instances": [],
+            "LaunchConfigurationName": "launch-config-name",
+        }
+    ],
+    "ResponseMetadata": {"HTTPStatusCode": 200},
+}
+
+_ASG_PAGE_LAUNCH_TEMPLATE = {
+    "AutoScalingGroups": [
+        {
+            **_BASE_ASG,
+            "Instances": [
+                {
+                    "AvailabilityZone": "us-west-1d",
+                    "HealthStatus": "Healthy",
+                    "InstanceId": "i-xxxxxxxxxxxxxxxxx",
+                    "LaunchTemplate": {
+                        "LaunchTemplateId": "lt-xxxxxxxxxxxxxxxxx",
+                        "LaunchTemplateName": "old-launch-template-name",
+                        "Version": "1",
+                    },
+                    "LifecycleState": "InService",
+                    "ProtectedFromScaleIn": False,
+                },
+            ],
+            "LaunchTemplate": {
+                "LaunchTemplateId": "lt-xxxxxxxxxxxxxxxxx",
+                "LaunchTemplateName": "launch-template-name",
+                "Version": "1",
+            },
+        }
+    ],
+    "ResponseMetadata": {"HTTPStatusCode": 200},
+}
+
+# ECE001: Expression is too complex (7.5 > 7). It's the way the API is defined.
+_DESCRIBE_INSTANCES_PAGE_WITH_TIMEZONE = {  # noqa: ECE001
+    "Reservations": [
+        {
+            "Groups": [],
+            "Instances": [
+                {
+                    "InstanceId": "i-xxxxxxxxxxxxxxxxx",
+                    "InstanceType": "t2.medium",
+                    "LaunchTime": datetime.datetime(
+                        2020, 6, 8, 11, 29, 27, tzinfo=datetime.timezone.utc
+                    ),
+                    "PrivateIpAddress": "192.168.1.13",
+                    "State": {"Code": 16, "Name": "running"},
+                }
+            ],
+        }
+    ],
+    "ResponseMetadata": {"HTTPStatusCode": 200},
+}
 
-    yield boto
+
+@pytest.fixture(name="boto_patch", scope="module")
+def boto_patch_() -> Generator[Mock, None, None]:
+    """Patch the boto session once for all the tests of the module.
+
+    Building the autospec of the boto session is slow.
+    """
+    boto_patch = patch("boto3.session.Session", autospec=True)
+    session = boto_patch.start()
+
+    yield session.return_value.client
 
     boto_patch.stop()
 
 
+@pytest.fixture(name="boto")
+def boto_(boto_patch: Mock) -> Mock:
+    """Prepare the mock of the boto client factory."""
+    boto_patch.reset_mock(return_value=True, side_effect=True)
+    return boto_patch
+
+
+@pytest.fixture(name="paginators")
+def paginators_(boto: Mock) -> Dict[str, Mock]:
+    """Prepare a mock paginator for each boto operation."""
+    paginators: Dict[str, Mock] = defaultdict(Mock)
+    boto.return_value.get_paginator.side_effect = paginators.__getitem__
+    return paginators
+
+
 # W0613: boto is not used, but it is, as we're using it to initialize the patch on each
 # test.
 @pytest.fixture(name="aws")
@@ -31,7 +172,9 @@ def aws_(boto: Mock) -> AWS:  # noqa: W0613
     return AWS()
 
 
-def test_check_config_happy_path(aws: AWS, caplog: LogCaptureFixture) -> None:
+def test_check_config_happy_path(
+    aws: AWS, boto: Mock, caplog: LogCaptureFixture
+) -> None:
     """
     Given: A correctly configured AWS adapter object.
     When: Configuration is checked
@@ -40,6 +183,7 @@ def test_check_config_happy_path(aws: AWS, caplog: LogCaptureFixture) -> None:
     aws.check_configuration()  # act
 
     assert ("drode.adapters.aws", logging.INFO, "AWS: OK") in caplog.record_tuples
+    boto.return_value.get_caller_identity.assert_called_once_with()
 
 
 def test_check_config_unauthorized_error(
@@ -50,7 +194,7 @@ def test_check_config_unauthorized_error(
     When: Configuration is checked.
     Then: The user is informed of the incorrect state and an exception is raised.
     """
-    boto.client.side_effect = NoRegionError()
+    boto.side_effect = NoRegionError()
 
     with pytest.raises(AWSConfigurationError):
         aws.check_configuration()
@@ -58,66 +202,19 @@ def test_check_config_unauthorized_error(
     assert ("drode.adapters.aws", logging.ERROR, "AWS: KO") in caplog.record_tuples
 
 
-def test_get_autoscaling_returns_instances_info(aws: AWS, boto: Mock) -> None:
+def test_get_autoscaling_returns_instances_info(
+    aws: AWS, paginators: Dict[str, Mock]
+) -> None:
     """
     Given: An AWS adapter.
     When: Using the get_autoscaling_group method.
     Then: The information of the autoscaling group and it's associated resources is
         returned.
     """
-    boto = boto.client.return_value
-    boto.describe_auto_scaling_groups.return_value = {
-        "AutoScalingGroups": [
-            {
-                "AutoScalingGroupARN": "autoscaling_arn",
-                "AutoScalingGroupName": "production_autoscaling_group_name",
-                "AvailabilityZones": ["us-west-1a", "us-west-1b", "us-west-1c"],
-                "CreatedTime": datetime.datetime(2020, 5, 19, 16, 8, 26, 535000),
-                "DefaultCooldown": 300,
-                "DesiredCapacity": 2,
-                "EnabledMetrics": [],
-                "HealthCheckGracePeriod": 300,
-                "HealthCheckType": "ELB",
-                "Instances": [
-                    {
-                        "AvailabilityZone": "us-west-1d",
-                        "HealthStatus": "Healthy",
-                        "InstanceId": "i-xxxxxxxxxxxxxxxxx",
-                        "LaunchConfigurationName": "old-launch-config-name",
-                        "LifecycleState": "InService",
-                        "ProtectedFromScaleIn": False,
-                    },
-                ],
-                "LaunchConfigurationName": "launch-config-name",
-                "LoadBalancerNames": [],
-                "MaxSize": 10,
-                "MinSize": 2,
-                "NewInstancesProtectedFromScaleIn": False,
-                "ServiceLinkedRoleARN": "servicelinkedrolearn",
-                "SuspendedProcesses": [],
-                "TargetGroupARNs": ["target_group_arn"],
-                "TerminationPolicies": ["Default"],
-            }
-        ],
-        "ResponseMetadata": {"HTTPStatusCode": 200},
-    }
-    # ECE001: Expression is too complex (7.5 > 7). It's the way the API is defined.
-    boto.describe_instances.return_value = {  # noqa: ECE001
-        "Reservations": [
-            {
-                "Groups": [],
-                "Instances": [
-                    {
-                        "InstanceType": "t2.medium",
-                        "LaunchTime": datetime.datetime(2020, 6, 8, 11, 29, 27),
-                        "PrivateIpAddress": "192.168.1.13",
-                        "State": {"Code": 16, "Name": "running"},
-                    }
-                ],
-            }
-        ],
-        "ResponseMetadata": {"HTTPStatusCode": 200},
-    }
+    paginators["describe_auto_scaling_groups"].paginate.return_value = [
+        _ASG_PAGE_LAUNCH_CONFIG
+    ]
+    paginators["describe_instances"].paginate.return_value = [_DESCRIBE_INSTANCES_PAGE]
     desired_result = AutoscalerInfo(
         template="launch-config-name",
         instances=[
@@ -134,19 +231,108 @@ def test_get_autoscaling_returns_instances_info(aws: AWS, boto: Mock) -> None:
     result = aws.get_autoscaling_group("production_autoscaling_group_name")
 
     assert result == desired_result
+    paginators["describe_instances"].paginate.assert_called_once_with(
+        InstanceIds=["i-xxxxxxxxxxxxxxxxx"]
+    )
+
+
+def test_get_autoscaling_reuses_the_boto_clients(
+    aws: AWS, boto: Mock, paginators: Dict[str, Mock]
+) -> None:
+    """
+    Given: An AWS adapter.
+    When: Using the get_autoscaling_group method twice.
+    Then: The boto clients are only created the first time.
+    """
+    paginators["describe_auto_scaling_groups"].paginate.return_value = [
+        _ASG_PAGE_WITHOUT_INSTANCES
+    ]
+    aws.get_autoscaling_group("production_autoscaling_group_name")
 
+    aws.get_autoscaling_group("production_autoscaling_group_name")  # act
 
-def test_get_autoscaling_handles_unexistent(aws: AWS, boto: Mock) -> None:
+    assert boto.call_count == 2
+
+
+def test_get_autoscaling_handles_groups_without_instances(
+    aws: AWS, paginators: Dict[str, Mock]
+) -> None:
+    """
+    Given: An AWS adapter and an autoscaling group without instances.
+    When: Using the get_autoscaling_group method.
+    Then: The EC2 instances are not queried, as an empty list of ids returns all
+        the instances of the account.
+    """
+    paginators["describe_auto_scaling_groups"].paginate.return_value = [
+        _ASG_PAGE_WITHOUT_INSTANCES
+    ]
+
+    result = aws.get_autoscaling_group("production_autoscaling_group_name")
+
+    assert result == AutoscalerInfo(template="launch-config-name")
+    assert "describe_instances" not in paginators
+
+
+def test_get_autoscaling_groups_fetches_all_groups_at_once(
+    aws: AWS, paginators: Dict[str, Mock]
+) -> None:
+    """
+    Given: An AWS adapter.
+    When: Using the get_autoscaling_groups method with two group names.
+    Then: Both groups are fetched with one query.
+    """
+    paginators["describe_auto_scaling_groups"].paginate.return_value = [
+        {
+            "AutoScalingGroups": [
+                {
+                    "AutoScalingGroupName": "production_autoscaling_group_name",
+                    "Instances": [],
+                    "LaunchConfigurationName": "production-launch-config-name",
+                },
+                {
+                    "AutoScalingGroupName": "staging_autoscaling_group_name",
+                    "Instances": [],
+                    "LaunchConfigurationName": "staging-launch-config-name",
+                },
+            ],
+        }
+    ]
+
+    result = aws.get_autoscaling_groups(
+        ["production_autoscaling_group_name", "staging_autoscaling_group_name"]
+    )
+
+    assert result == {
+        "production_autoscaling_group_name": AutoscalerInfo(
+            template="production-launch-config-name"
+        ),
+        "staging_autoscaling_group_name": AutoscalerInfo(
+            template="staging-launch-config-name"
+        ),
+    }
+    paginators["describe_auto_scaling_groups"].paginate.assert_called_once_with(
+        AutoScalingGroupNames=[
+            "production_autoscaling_group_name",
+            "staging_autoscaling_group_name",
+        ]
+    )
+
+
+def test_get_autoscaling_handles_unexistent(
+    aws: AWS, paginators: Dict[str, Mock]
+) -> None:
     """
     Given: An AWS adapter.
     When: Using the get_autoscaling_group on an inexistent autoscaling group.
     Then: An exception is raised.
     """
-    boto = boto.client.return_value
-    boto.describe_auto_scaling_groups.return_value = {
+    autoscaling_page = {
         "AutoScalingGroups": [],
         "ResponseMetadata": {"HTTPStatusCode": 200},
     }
+    paginators["describe_auto_scaling_groups"].paginate.return_value = [
+        autoscaling_page
+    ]
 
     with pytest.raises(AWSStateError) as error:
         aws.get_autoscaling_group("inexistent_autoscaling_group")
@@ -156,73 +342,20 @@ def test_get_autoscaling_handles_unexistent(aws: AWS, boto: Mock) -> None:
     )
 
 
-def test_get_autoscaling_handles_launch_templates(aws: AWS, boto: Mock) -> None:
+def test_get_autoscaling_handles_launch_templates(
+    aws: AWS, paginators: Dict[str, Mock]
+) -> None:
     """
     Given: An AWS adapter and an existing autoscaling group using launch templates.
     When: Using the get_autoscaling_group.
     Then: The information of the launch template is returned
     """
-    boto = boto.client.return_value
-    boto.describe_auto_scaling_groups.return_value = {
-        "AutoScalingGroups": [
-            {
-                "AutoScalingGroupARN": "autoscaling_arn",
-                "AutoScalingGroupName": "production_autoscaling_group_name",
-                "AvailabilityZones": ["us-west-1a", "us-west-1b", "us-west-1c"],
-                "CreatedTime": datetime.datetime(2020, 5, 19, 16, 8, 26, 535000),
-                "DefaultCooldown": 300,
-                "DesiredCapacity": 2,
-                "EnabledMetrics": [],
-                "HealthCheckGracePeriod": 300,
-                "HealthCheckType": "ELB",
-                "Instances": [
-                    {
-                        "AvailabilityZone": "us-west-1d",
-                        "HealthStatus": "Healthy",
-                        "InstanceId": "i-xxxxxxxxxxxxxxxxx",
-                        "LaunchTemplate": {
-                            "LaunchTemplateId": "lt-xxxxxxxxxxxxxxxxx",
-                            "LaunchTemplateName": "old-launch-template-name",
-                            "Version": "1",
-                        },
-                        "LifecycleState": "InService",
-                        "ProtectedFromScaleIn": False,
-                    },
-                ],
-                "LaunchTemplate": {
-                    "LaunchTemplateId": "lt-xxxxxxxxxxxxxxxxx",
-                    "LaunchTemplateName": "launch-template-name",
-                    "Version": "1",
-                },
-                "LoadBalancerNames": [],
-                "MaxSize": 10,
-                "MinSize": 2,
-                "NewInstancesProtectedFromScaleIn": False,
-                "ServiceLinkedRoleARN": "servicelinkedrolearn",
-                "SuspendedProcesses": [],
-                "TargetGroupARNs": ["target_group_arn"],
-                "TerminationPolicies": ["Default"],
-            }
-        ],
-        "ResponseMetadata": {"HTTPStatusCode": 200},
-    }
-    # ECE001: Expression is too complex (7.5 > 7). It's the way the API is defined.
-    boto.describe_instances.return_value = {  # noqa: ECE001
-        "Reservations": [
-            {
-                "Groups": [],
-                "Instances": [
-                    {
-                        "InstanceType": "t2.medium",
-                        "LaunchTime": datetime.datetime(2020, 6, 8, 11, 29, 27),
-                        "PrivateIpAddress": "192.168.1.13",
-                        "State": {"Code": 16, "Name": "running"},
-                    }
-                ],
-            }
-        ],
-        "ResponseMetadata": {"HTTPStatusCode": 200},
-    }
+    paginators["describe_auto_scaling_groups"].paginate.return_value = [
+        _ASG_PAGE_LAUNCH_TEMPLATE
+    ]
+    paginators["describe_instances"].paginate.return_value = [
+        _DESCRIBE_INSTANCES_PAGE_WITH_TIMEZONE
+    ]
     desired_result = AutoscalerInfo(
         template="launch-template-name:1",
         instances=[
@@ -1,12 +1,16 @@
 """Test the integration with the drone service."""
 
+import json
 import logging
+from unittest.mock import Mock, call
 
 import pytest
+import requests
 from _pytest.logging import LogCaptureFixture
 from requests_mock.mocker import Mocker
 
 from drode.adapters.drone import (
+    BUILDS_PER_PAGE,
     Drone,
     DroneAPIError,
     DroneBuildError,
@@ -15,11 +19,49 @@ from drode.adapters.drone import (
 
 from ...factories import BuildInfoFactory
 
-
-@pytest.fixture(name="drone")
+_DRONE_URL = "https://drone.url"
+_BUILDS_URL = f"{_DRONE_URL}/api/repos/owner/repository/builds"
+# Build history of a pipeline whose last build is not a push to master. It's
+# serialized once so the mocked requests don't encode it on each call.
+_BUILD_HISTORY = [
+    BuildInfoFactory.build(
+        id=882,
+        number=209,
+        finished=1,
+        status="success",
+        source="feat/1",
+        target="feat/1",
+    ).__dict__,
+    BuildInfoFactory.build(
+        id=881,
+        number=208,
+        finished=1,
+        status="success",
+        source="master",
+        target="master",
+        event="promote",
+    ).__dict__,
+    BuildInfoFactory.build(
+        id=880,
+        number=207,
+        finished=1,
+        status="success",
+        source="master",
+        target="master",
+        event="push",
+    ).__dict__,
+]
+_BUILD_HISTORY_CONTENT = json.dumps(_BUILD_HISTORY).encode()
+
+
+@pytest.fixture(name="drone", scope="session")
 def drone_() -> Drone:
-    """Prepare the Drone object to test."""
-    return Drone("https://drone.url", "drone_token")
+    """Prepare the Drone object to test.
+
+    The adapter has no state besides its HTTP session, which requests_mock
+    intercepts in each test, so it's shared by all of them.
+    """
+    return Drone(_DRONE_URL, "drone_token")
 
 
 def test_check_config_happy_path(
@@ -30,7 +72,7 @@ def test_check_config_happy_path(
     When: Configuration is checked
     Then: The user is informed of the correct state.
     """
-    requests_mock.get(f"{drone.drone_url}/api/user/repos", text="OK")
+    requests_mock.get(f"{_DRONE_URL}/api/user/repos", text="OK")
 
     drone.check_configuration()  # act
 
@@ -45,7 +87,7 @@ def test_check_config_unauthorized_error(
     When: Configuration is checked.
     Then: The user is informed of the incorrect state and an exception is raised.
     """
-    requests_mock.get(f"{drone.drone_url}/api/user/repos", status_code=401)
+    requests_mock.get(f"{_DRONE_URL}/api/user/repos", status_code=401)
 
     with pytest.raises(DroneConfigurationError):
         drone.check_configuration()
@@ -78,7 +120,7 @@ def test_build_info_returns_expected_json(drone: Drone, requests_mock: Mocker) -
         ).__dict__,
     )
     requests_mock.get(
-        f"{drone.drone_url}/api/repos/owner/repository/builds/274",
+        f"{_BUILDS_URL}/274",
         json=response_json,
         status_code=200,
     )
@@ -97,7 +139,7 @@ def test_build_info_raises_exception_if_build_number_doesnt_exist(
     Then: A DroneAPIError exception is raised
     """
     requests_mock.get(
-        f"{drone.drone_url}/api/repos/owner/repository/builds/9999",
+        f"{_BUILDS_URL}/9999",
         status_code=404,
     )
 
@@ -117,38 +159,7 @@ def test_last_build_info_returns_the_last_build_json(
     When: The last_build_info is called.
     Then: The last job build information is returned.
     """
-    response_json = [
-        BuildInfoFactory.build(
-            id=882,
-            number=209,
-            finished=1,
-            status="success",
-            source="feat/1",
-            target="feat/1",
-        ).__dict__,
-        BuildInfoFactory.build(
-            id=881,
-            number=208,
-            finished=1,
-            status="success",
-            source="master",
-            target="master",
-            event="promote",
-        ).__dict__,
-        BuildInfoFactory.build(
-            id=880,
-            number=207,
-            finished=1,
-            status="success",
-            source="master",
-            target="master",
-            event="push",
-        ).__dict__,
-    ]
-    requests_mock.get(
-        f"{drone.drone_url}/api/repos/owner/repository/builds",
-        json=response_json,
-    )
+    requests_mock.get(_BUILDS_URL, content=_BUILD_HISTORY_CONTENT)
 
     result = drone.last_build_info("owner/repository")
 
@@ -163,41 +174,68 @@ def test_last_success_build_info_searches_master_and_push_events_by_default(
     When: The last_success_build_info is called.
     Then: The last successful push event to master build number is returned.
     """
+    requests_mock.get(_BUILDS_URL, content=_BUILD_HISTORY_CONTENT)
+
+    result = drone.last_success_build_info("owner/repository").number
+
+    assert result == 207
+    assert requests_mock.request_history[0].qs["branch"] == ["master"]
+
+
+def test_last_success_build_info_encodes_the_branch(
+    drone: Drone, requests_mock: Mocker
+) -> None:
+    """
+    Given: A branch whose name has characters with special meaning in a query string.
+    When: The last_success_build_info is called with that branch.
+    Then: The branch is sent encoded, so the server filters by the whole name.
+    """
     requests_mock.get(
-        f"{drone.drone_url}/api/repos/owner/repository/builds",
+        _BUILDS_URL,
         json=[
             BuildInfoFactory.build(
-                id=882,
-                number=209,
-                finished=1,
-                status="success",
-                source="feat/1",
-                target="feat/1",
-            ).__dict__,
+                number=207, status="success", target="feat/a+b", event="push"
+            ).__dict__
+        ],
+    )
+
+    result = drone.last_success_build_info("owner/repository", "feat/a+b").number
+
+    assert result == 207
+    assert "branch=feat%2Fa%2Bb" in requests_mock.request_history[0].url
+
+
+def test_last_success_build_info_searches_older_pages(
+    drone: Drone, requests_mock: Mocker
+) -> None:
+    """
+    Given: A pipeline whose last successful push to master is not in the first page
+        of the build history.
+    When: The last_success_build_info is called.
+    Then: The next page is fetched and the build is returned.
+    """
+    requests_mock.get(
+        f"{_BUILDS_URL}?page=1",
+        json=[
             BuildInfoFactory.build(
-                id=881,
-                number=208,
-                finished=1,
-                status="success",
-                source="master",
-                target="master",
-                event="promote",
-            ).__dict__,
+                number=300 - index, status="failure", target="master", event="push"
+            ).__dict__
+            for index in range(BUILDS_PER_PAGE)
+        ],
+    )
+    requests_mock.get(
+        f"{_BUILDS_URL}?page=2",
+        json=[
             BuildInfoFactory.build(
-                id=880,
-                number=207,
-                finished=1,
-                status="success",
-                source="master",
-                target="master",
-                event="push",
-            ).__dict__,
+                number=207, status="success", target="master", event="push"
+            ).__dict__
         ],
     )
 
     result = drone.last_success_build_info("owner/repository").number
 
     assert result == 207
+    assert requests_mock.call_count == 2
 
 
 def test_last_success_build_info_handles_no_result(
@@ -209,7 +247,7 @@ def test_last_success_build_info_handles_no_result(
     Then: DroneBuildError exception is raised.
     """
     requests_mock.get(
-        f"{drone.drone_url}/api/repos/owner/repository/builds",
+        _BUILDS_URL,
         json=[
             BuildInfoFactory.build(
                 id=882,
@@ -269,7 +307,8 @@ def test_get_retries_url_if_there_are_errors(
 ) -> None:
     """
     Given: A Drone adapter.
-    When: Using the get method and the API returns a 401 less than the maximum allowed.
+    When: Using the get method and the API returns retryable errors less than the
+        maximum allowed.
     Then: A requests object is returned with the query result.
     """
     # ignore: Argument 2 to "get" of "MockerCore" has incompatible type
@@ -278,10 +317,10 @@ def test_get_retries_url_if_there_are_errors(
     requests_mock.get(
         "http://url",
         [
-            {"status_code": 401},
-            {"status_code": 401},
-            {"status_code": 401},
-            {"status_code": 401},
+            {"status_code": 500},
+            {"status_code": 502},
+            {"status_code": 503},
+            {"status_code": 429},
             {"text": "hi", "status_code": 200},
         ],
     )
@@ -295,7 +334,8 @@ def test_get_retries_url_if_there_are_errors(
 def test_get_handles_url_errors(drone: Drone, requests_mock: Mocker) -> None:
     """
     Given: A Drone adapter.
-    When: Using the get method and the API returns a 401 more than the allowed retries.
+    When: Using the get method and the API returns a 500 more than the allowed
+        retries.
     Then: a DroneAPIError exception is raised.
     """
     # ignore: Argument 2 to "get" of "MockerCore" has incompatible type
@@ -304,19 +344,81 @@ def test_get_handles_url_errors(drone: Drone, requests_mock: Mocker) -> None:
     requests_mock.get(
         "http://url",
         [
-            {"status_code": 401},
-            {"status_code": 401},
-            {"status_code": 401},
-            {"status_code": 401},
-            {"status_code": 401},
-            {"status_code": 401},
+            {"status_code": 500},
+            {"status_code": 500},
+            {"status_code": 500},
+            {"status_code": 500},
+            {"status_code": 500},
+            {"status_code": 500},
         ],
     )
 
     with pytest.raises(DroneAPIError) as error:
         drone.get("http://url")
 
-    assert "401 error while trying to access http://url" in str(error.value)
+    assert "500 error while trying to access http://url" in str(error.value)
+
+
+@pytest.mark.parametrize("status_code", [401, 403, 404])
+def test_get_doesnt_retry_client_errors(
+    drone: Drone,
+    requests_mock: Mocker,
+    monkeypatch: pytest.MonkeyPatch,
+    status_code: int,
+) -> None:
+    """
+    Given: A Drone adapter.
+    When: Using the get method and the API returns a client error.
+    Then: A DroneAPIError is raised after a single request, without waiting.
+    """
+    requests_mock.get("http://url", status_code=status_code)
+    time_mock = Mock(spec=["sleep"])
+    monkeypatch.setattr("drode.adapters.drone.time", time_mock)
+
+    with pytest.raises(DroneAPIError) as error:
+        drone.get("http://url")
+
+    assert f"{status_code} error while trying to access http://url" in str(error.value)
+    assert requests_mock.call_count == 1
+    time_mock.sleep.assert_not_called()
+
+
+def test_get_backs_off_exponentially_between_retries(
+    drone: Drone, requests_mock: Mocker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Given: A Drone adapter.
+    When: Using the get method and the API keeps returning errors.
+    Then: The time between attempts doubles on each retry, and there is no wait
+        after the last attempt.
+    """
+    requests_mock.get("http://url", status_code=500)
+    monkeypatch.setattr("drode.adapters.drone.RETRY_DELAY", 0.1)
+    time_mock = Mock(spec=["sleep"])
+    monkeypatch.setattr("drode.adapters.drone.time", time_mock)
+    random_mock = Mock(spec=["uniform"])
+    random_mock.uniform.return_value = 1
+    monkeypatch.setattr("drode.adapters.drone.random", random_mock)
+
+    with pytest.raises(DroneAPIError):
+        drone.get("http://url")
+
+    assert time_mock.sleep.mock_calls == [call(0.1), call(0.2), call(0.4), call(0.8)]
+
+
+def test_get_handles_connection_errors(drone: Drone, requests_mock: Mocker) -> None:
+    """
+    Given: A Drone adapter.
+    When: Using the get method and the server can't be reached.
+    Then: a DroneAPIError exception is raised.
+    """
+    requests_mock.get("http://url", exc=requests.exceptions.ConnectTimeout)
+
+    with pytest.raises(DroneAPIError) as error:
+        drone.get("http://url")
+
+    assert "while trying to access http://url" in str(error.value)
+    assert requests_mock.call_count == 5
 
 
 def test_promote_launches_promote_drone_job(
@@ -328,7 +430,7 @@ def test_promote_launches_promote_drone_job(
     Then: Calls the promote API method with the desired build number.
     """
     requests_mock.get(
-        f"{drone.drone_url}/api/repos/owner/repository/builds/172",
+        f"{_BUILDS_URL}/172",
         json=BuildInfoFactory.build(
             id=882,
             number=172,
@@ -339,10 +441,7 @@ def test_promote_launches_promote_drone_job(
             message="updated README",
         ).__dict__,
     )
-    promote_url = (
-        f"{drone.drone_url}/api/repos/owner/repository/builds/172/promote"
-        "?target=production"
-    )
+    promote_url = f"{_BUILDS_URL}/172/promote?target=production"
     requests_mock.post(
         promote_url,
         json=BuildInfoFactory.build(
@@ -0,0 +1,56 @@
+"""Store the fixtures used by the service tests."""
+
+import pytest
+
+from drode.adapters.drone import BuildInfo
+
+from ...factories import make_build_info
+
+# BuildInfo is frozen, so the builds are built once and shared by all the tests.
+
+
+@pytest.fixture(name="feature_build", scope="session")
+def feature_build_() -> BuildInfo:
+    """Prepare a successful push build of a feature branch."""
+    return make_build_info(
+        number=209,
+        finished=1,
+        target="feat/1",
+        status="success",
+        event="push",
+    )
+
+
+@pytest.fixture(name="master_build", scope="session")
+def master_build_() -> BuildInfo:
+    """Prepare a successful push build of the master branch."""
+    return make_build_info(
+        number=208,
+        finished=1,
+        target="master",
+        status="success",
+        event="push",
+        after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
+        message="updated README",
+    )
+
+
+@pytest.fixture(name="running_build", scope="session")
+def running_build_() -> BuildInfo:
+    """Prepare a running promote build."""
+    return make_build_info(
+        number=209,
+        event="promote",
+        trigger="trigger_author",
+        finished=0,
+    )
+
+
+@pytest.fixture(name="finished_build", scope="session")
+def finished_build_() -> BuildInfo:
+    """Prepare the running build once it has successfully finished."""
+    return make_build_info(
+        number=209,
+        finished=1591129124,
+        status="success",
+    )
@@ -136,3 +136,30 @@ def test_set_active_project_handles_inexistent(config: Config) -> None:
 
     with pytest.raises(ConfigError):
         services.set_active_project(config, "inexistent_project")
+
+
+def test_get_active_project_follows_the_config_changes(config: Config) -> None:
+    """
+    Given: A configuration whose active project has already been resolved.
+    When: The active project is changed and asked for again.
+    Then: The new active project is returned.
+    """
+    services.get_active_project(config)
+    config["active_project"] = "test_project_2"
+
+    result = services.get_active_project(config)
+
+    assert result == "test_project_2"
+
+
+def test_get_active_project_sees_nested_changes(config: Config) -> None:
+    """
+    Given: A configuration whose active project has already been resolved.
+    When: The active project is removed through the nested projects dictionary.
+    Then: An error is raised instead of returning the removed project.
+    """
+    services.get_active_project(config)
+    del config["projects"][config["active_project"]]
+
+    with pytest.raises(ConfigError):
+        services.get_active_project(config)
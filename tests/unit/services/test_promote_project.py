@@ -1,53 +1,49 @@
 """Test the promote service."""
 
 import logging
-from unittest.mock import call, patch
+from unittest.mock import Mock
 
 import pytest
 from _pytest.logging import LogCaptureFixture
 from tests.fake_adapters import FakeDrone
 
 from drode import services
-from drode.adapters.drone import DronePromoteError
+from drode.adapters.drone import BuildInfo, DronePromoteError
 
-from ...factories import BuildInfoFactory
+from ...factories import make_build_info
+
+# User answers to the ask question and the expected result.
+_ASK_CASES = (
+    ("yes", True),
+    ("y", True),
+    ("Y", True),
+    (" yes\n", True),
+    ("no", False),
+    ("n", False),
+    ("", False),
+)
 
 
 def test_promote_promotes_desired_build_number(
-    drone: FakeDrone, caplog: LogCaptureFixture
+    drone: FakeDrone,
+    caplog: LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    feature_build: BuildInfo,
+    master_build: BuildInfo,
 ) -> None:
     """
     Given: A series of successful pipelines.
     When: the promote service is called with a valid build number.
     Then: The build is promoted.
     """
-    drone.set_builds(
-        [
-            BuildInfoFactory.build(
-                number=209,
-                finished=1,
-                target="feat/1",
-                status="success",
-                event="push",
-            ),
-            BuildInfoFactory.build(
-                number=208,
-                finished=1,
-                target="master",
-                status="success",
-                event="push",
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-            ),
-        ],
-    )
-    with patch("drode.services.ask", return_value=True) as ask_mock:
-        # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
+    drone.set_builds([feature_build, master_build])
+    ask_mock = Mock(return_value=True)
+    monkeypatch.setattr("drode.services.ask", ask_mock)
 
-        result = services.promote(drone, "owner/repository", "production", 208)
+    result = services.promote(drone, "owner/repository", "production", 208)
 
     assert result == 210
-    assert [call("Are you sure? [y/N]: ")] == ask_mock.mock_calls
+    ask_mock.assert_called_once_with("Are you sure? [y/N]: ")
     assert (
         "drode.services",
         logging.INFO,
@@ -57,7 +53,10 @@ def test_promote_promotes_desired_build_number(
 
 
 def test_promote_does_nothing_if_user_doesnt_confirm(
-    drone: FakeDrone, caplog: LogCaptureFixture
+    drone: FakeDrone,
+    caplog: LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    master_build: BuildInfo,
 ) -> None:
     """
     Given: A successful pipeline.
@@ -65,26 +64,14 @@ def test_promote_does_nothing_if_user_doesnt_confirm(
         confirm the operation.
     Then: The build is not promoted.
     """
-    drone.set_builds(
-        [
-            BuildInfoFactory.build(
-                number=208,
-                finished=1,
-                target="master",
-                status="success",
-                event="push",
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-            )
-        ],
-    )
-    with patch("drode.services.ask", return_value=False) as ask_mock:
-        # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
+    drone.set_builds([master_build])
+    ask_mock = Mock(return_value=False)
+    monkeypatch.setattr("drode.services.ask", ask_mock)
 
-        result = services.promote(drone, "owner/repository", "production", 208)
+    result = services.promote(drone, "owner/repository", "production", 208)
 
     assert result is None
-    assert [call("Are you sure? [y/N]: ")] == ask_mock.mock_calls
+    ask_mock.assert_called_once_with("Are you sure? [y/N]: ")
     assert (
         "drode.services",
         logging.INFO,
@@ -100,7 +87,7 @@ def test_promote_doesnt_promote_failed_jobs(drone: FakeDrone) -> None:
     """
     drone.set_builds(
         [
-            BuildInfoFactory.build(
+            make_build_info(
                 number=209,
                 status="killed",
             )
@@ -116,40 +103,25 @@ def test_promote_doesnt_promote_failed_jobs(drone: FakeDrone) -> None:
 
 
 def test_promote_launches_last_successful_master_job_if_none(
-    drone: FakeDrone, caplog: LogCaptureFixture
+    drone: FakeDrone,
+    caplog: LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    feature_build: BuildInfo,
+    master_build: BuildInfo,
 ) -> None:
     """
     Given: A series of successful pipelines
     When: the promote service is called without any build.
     Then: The last successful build that pushed to master is promoted.
     """
-    drone.set_builds(
-        [
-            BuildInfoFactory.build(
-                number=209,
-                finished=1,
-                target="feat/1",
-                status="success",
-                event="push",
-            ),
-            BuildInfoFactory.build(
-                number=208,
-                finished=1,
-                target="master",
-                status="success",
-                event="push",
-                after="9fc1ad6ebf12462f3f9773003e26b4c6f54a772e",
-                message="updated README",
-            ),
-        ],
-    )
-    with patch("drode.services.ask", return_value=True) as ask_mock:
-        # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
+    drone.set_builds([feature_build, master_build])
+    ask_mock = Mock(return_value=True)
+    monkeypatch.setattr("drode.services.ask", ask_mock)
 
-        result = services.promote(drone, "owner/repository", "production")
+    result = services.promote(drone, "owner/repository", "production")
 
     assert result == 210
-    assert [call("Are you sure? [y/N]: ")] == ask_mock.mock_calls
+    ask_mock.assert_called_once_with("Are you sure? [y/N]: ")
     assert (
         "drode.services",
         logging.INFO,
@@ -158,31 +130,51 @@ def test_promote_launches_last_successful_master_job_if_none(
     ) in caplog.record_tuples
 
 
-@pytest.mark.parametrize("answer", ["yes", "y"])
-def test_ask_returns_true_if_user_anwers_yes(answer: str) -> None:
+@pytest.mark.parametrize(
+    ("answer", "expected"),
+    _ASK_CASES,
+    ids=[repr(answer) for answer, _ in _ASK_CASES],
+)
+def test_ask_returns_the_user_answer(
+    answer: str, expected: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """
     Given: Nothing
-    When: The user answers yes or y to the ask question
-    Then: it returns True
+    When: The user answers the ask question
+    Then: it returns True if the answer is yes or y, in any case and with
+        surrounding whitespace, and False otherwise
+    """
+    monkeypatch.setattr("builtins.input", lambda _: answer)
+
+    result = services.ask("Do you want to continue? ([y]/n): ")
+
+    assert result is expected
+
+
+def test_ask_returns_true_if_assume_yes_is_set(monkeypatch: pytest.MonkeyPatch) -> None:
     """
-    with patch("builtins.input", return_value=answer):
-        # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
+    Given: The DRODE_ASSUME_YES environmental variable is set.
+    When: ask is called
+    Then: it returns True without prompting the user
+    """
+    monkeypatch.setenv("DRODE_ASSUME_YES", "1")
+    input_mock = Mock()
+    monkeypatch.setattr("builtins.input", input_mock)
 
-        result = services.ask("Do you want to continue? ([y]/n): ")
+    result = services.ask("Do you want to continue? ([y]/n): ")
 
     assert result
+    input_mock.assert_not_called()
 
 
-@pytest.mark.parametrize("answer", ["no", "n", ""])
-def test_ask_returns_false_otherwise(answer: str) -> None:
+def test_ask_returns_false_if_stdin_is_closed(monkeypatch: pytest.MonkeyPatch) -> None:
     """
-    Given: Nothing
-    When: The user answers no or empty to the ask question
-    Then: it returns True
+    Given: A closed standard input
+    When: ask is called
+    Then: it returns False
     """
-    with patch("builtins.input", return_value=answer):
-        # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
+    monkeypatch.setattr("builtins.input", Mock(side_effect=EOFError))
 
-        result = services.ask("Do you want to continue? ([y]/n): ")
+    result = services.ask("Do you want to continue? ([y]/n): ")
 
     assert not result
@@ -1,19 +1,24 @@
 """Tests the wait service."""
 
 import logging
-from unittest import mock
-from unittest.mock import call, patch
+from unittest.mock import Mock, call
 
+import pytest
 from _pytest.logging import LogCaptureFixture
 from tests.fake_adapters import FakeDrone
 
 from drode import services
+from drode.adapters.drone import BuildInfo
 
-from ...factories import BuildInfoFactory
+from ...factories import make_build_info
 
 
 def test_wait_waits_for_the_build_to_finish(
-    drone: FakeDrone, caplog: LogCaptureFixture
+    drone: FakeDrone,
+    caplog: LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    running_build: BuildInfo,
+    finished_build: BuildInfo,
 ) -> None:
     """
     Given: A running build with number 209.
@@ -21,29 +26,18 @@ def test_wait_waits_for_the_build_to_finish(
     Then: It will wait till the build has finished.
     """
     # The first time we query for the job 209, we'll get that it has not finished
-    drone.set_build_infos(
-        [
-            BuildInfoFactory.build(
-                number=209,
-                event="promote",
-                trigger="trigger_author",
-                finished=0,
-            ),
-            BuildInfoFactory.build(
-                number=209,
-                finished=1591129124,
-                status="success",
-            ),
-        ]
-    )
-    with mock.patch("drode.services.time") as time_mock:
-        # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
+    drone.set_build_infos([running_build, finished_build])
+    sleep = Mock()
+    random_mock = Mock()
+    random_mock.uniform.return_value = 1.05
+    monkeypatch.setattr("drode.services.random", random_mock)
 
-        result = services.wait(drone, "owner/repository", 209)
+    result = services.wait(drone, "owner/repository", 209, sleep=sleep)
 
     assert result
-    assert time_mock.sleep.mock_calls == [call(1)]
-    expected_calls = [
+    assert sleep.mock_calls == [call(0.2 * 1.05)]
+    random_mock.uniform.assert_called_once_with(1, 1.1)
+    expected_calls = {
         (
             "drode.services",
             logging.INFO,
@@ -54,42 +48,47 @@ def test_wait_waits_for_the_build_to_finish(
             logging.INFO,
             "Job #209 has finished with status success",
         ),
-    ]
-    for log_entry in expected_calls:
-        assert log_entry in caplog.record_tuples
+    }
+    assert expected_calls.issubset(caplog.record_tuples)
+
+
+def test_wait_backs_off_exponentially_while_the_build_is_running(
+    drone: FakeDrone,
+    monkeypatch: pytest.MonkeyPatch,
+    running_build: BuildInfo,
+    finished_build: BuildInfo,
+) -> None:
+    """
+    Given: A build that takes a while to finish.
+    When: the service wait is called with it's build number.
+    Then: The time between queries to the server grows with each query until it
+        reaches the maximum delay.
+    """
+    drone.set_build_infos([running_build] * 4 + [finished_build])
+    sleep = Mock()
+    random_mock = Mock()
+    random_mock.uniform.return_value = 1
+    monkeypatch.setattr("drode.services.random", random_mock)
+
+    result = services.wait(drone, "owner/repository", 209, max_delay=1, sleep=sleep)
+
+    assert result
+    assert sleep.mock_calls == [call(0.2), call(0.4), call(0.8), call(1)]
 
 
 def test_wait_defaults_to_the_last_build(
-    drone: FakeDrone, caplog: LogCaptureFixture
+    drone: FakeDrone,
+    caplog: LogCaptureFixture,
+    running_build: BuildInfo,
+    finished_build: BuildInfo,
 ) -> None:
     """
     Given: A pipeline has multiple build numbers
     When: the service wait is called without a build number.
     Then: It will wait on the last build number.
     """
-    drone.set_build_infos(
-        [
-            BuildInfoFactory.build(
-                number=209,
-                finished=0,
-            ),
-            BuildInfoFactory.build(
-                number=209,
-                event="promote",
-                trigger="trigger_author",
-                finished=0,
-            ),
-            BuildInfoFactory.build(
-                number=209,
-                finished=1591129124,
-                status="success",
-            ),
-        ],
-    )
-    with patch("drode.services.time"):
-        # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
-
-        result = services.wait(drone, "owner/repository")
+    drone.set_build_infos([running_build, running_build, finished_build])
+    result = services.wait(drone, "owner/repository", sleep=Mock())
 
     assert result
     assert (
@@ -99,6 +98,28 @@ def test_wait_defaults_to_the_last_build(
     ) in caplog.record_tuples
 
 
+def test_wait_reuses_the_last_build_information(
+    drone: FakeDrone,
+    monkeypatch: pytest.MonkeyPatch,
+    running_build: BuildInfo,
+    finished_build: BuildInfo,
+) -> None:
+    """
+    Given: A pipeline whose last build is running.
+    When: the service wait is called without a build number.
+    Then: The build information is not fetched again until the first poll interval
+        has passed.
+    """
+    drone.set_builds([running_build])
+    build_info_mock = Mock(return_value=finished_build)
+    monkeypatch.setattr(drone, "build_info", build_info_mock)
+
+    result = services.wait(drone, "owner/repository", sleep=Mock())
+
+    assert result
+    build_info_mock.assert_called_once_with("owner/repository", 209)
+
+
 def test_wait_returns_if_there_are_no_running_builds(
     drone: FakeDrone, caplog: LogCaptureFixture
 ) -> None:
@@ -108,7 +129,7 @@ def test_wait_returns_if_there_are_no_running_builds(
     Then: It will inform the user that there are no active jobs.
     """
     drone.set_builds(
-        [BuildInfoFactory.build(number=208, finished=1591129124, status="success")],
+        [make_build_info(number=208, finished=1591129124, status="success")],
     )
 
     result = services.wait(drone, "owner/repository")
@@ -1,20 +1,17 @@
 """Test the configuration of the program."""
 
-from unittest.mock import Mock, patch
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-from ruamel.yaml.parser import ParserError
 
 from drode.config import Config, ConfigError
 
 
-# R0903: too few methods. C'est la vie!
-class FileMarkMock:  # noqa: R0903
-    """Mock of the ruamel FileMark object."""
-
-    name: str = "mark"
-    line: int = 1
-    column: int = 1
+@pytest.fixture(name="config")
+def config_(config_file: str) -> Config:
+    """Configure a Config object that hasn't loaded the configuration file yet."""
+    return Config(config_file)
 
 
 def test_config_load(config: Config) -> None:
@@ -24,24 +21,49 @@ def test_config_load(config: Config) -> None:
     assert config.data["verbose"] == "info"
 
 
-@patch("drode.config.YAML")
-def test_load_handles_wrong_file_format(yaml_mock: Mock, config: Config) -> None:
+def test_load_handles_wrong_file_format(config: Config) -> None:
     """
     Given: A config file with wrong yaml format.
     When: configuration is loaded.
     Then: A ConfigError is returned.
     """
-    yaml_mock.return_value.load.side_effect = ParserError(
-        "error",
-        FileMarkMock(),
-        "problem",
-        FileMarkMock(),
-    )
+    with open(config.config_path, "w", encoding="utf-8") as file_cursor:
+        file_cursor.write("[ invalid yaml")
 
     with pytest.raises(ConfigError):
         config.load()
 
 
+def test_config_is_loaded_on_first_access(config: Config) -> None:
+    """
+    Given: A Config object whose configuration has not been accessed yet.
+    When: A configuration value is accessed.
+    Then: The configuration file is loaded.
+    """
+    with patch.object(config, "load", wraps=config.load) as load_mock:
+        # Until https://github.com/jamescooke/flake8-aaa/issues/192 is solved
+
+        result = config["verbose"]
+
+    assert result == "info"
+    load_mock.assert_called_once_with()
+
+
+def test_load_replaces_the_loaded_configuration(config: Config) -> None:
+    """
+    Given: A loaded configuration.
+    When: The configuration file is rewritten and loaded again.
+    Then: The data is replaced by the new content of the file.
+    """
+    config.load()
+    with open(config.config_path, "w", encoding="utf-8") as file_cursor:
+        file_cursor.write("verbose: debug")
+
+    config.load()  # act
+
+    assert config.data == {"verbose": "debug"}
+
+
 def test_save_config(config: Config) -> None:
     """Saving the configuration to the yaml file works."""
     config.data = {"a": "b"}
@@ -52,6 +74,65 @@ def test_save_config(config: Config) -> None:
         assert "a:" in file_cursor.read()
 
 
+def test_save_keeps_the_comments_of_the_file(config: Config) -> None:
+    """
+    Given: A configuration file with comments.
+    When: A value is changed and the configuration is saved.
+    Then: The new value is written and the comments are kept.
+    """
+    config.set("verbose", "debug")
+
+    config.save()  # act
+
+    with open(config.config_path, "r", encoding="utf-8") as file_cursor:
+        content = file_cursor.read()
+    assert "verbose: debug" in content
+    assert "# Level of logging verbosity." in content
+
+
+def test_save_keeps_the_yaml_1_1_values(config: Config) -> None:
+    """
+    Given: A configuration file with scalars that YAML 1.1 and 1.2 read differently.
+    When: Another value is changed, and the configuration is saved and loaded.
+    Then: The untouched scalars keep the values they were loaded with.
+    """
+    with open(config.config_path, "w", encoding="utf-8") as file_cursor:
+        file_cursor.write('---\nflag: yes\nswitch: on\nanswer: "yes"\nverbose: info\n')
+    config.load()
+    config.set("verbose", "debug")
+
+    config.save()  # act
+
+    config.load()
+    assert config.data == {
+        "flag": True,
+        "switch": True,
+        "answer": "yes",
+        "verbose": "debug",
+    }
+
+
+def test_save_doesnt_share_the_yaml_directive_between_files(
+    config: Config, tmp_path: Path
+) -> None:
+    """
+    Given: A configuration file with a %YAML directive that has been saved.
+    When: Another configuration file without the directive is saved.
+    Then: The directive is not added to the second file.
+    """
+    with open(config.config_path, "w", encoding="utf-8") as file_cursor:
+        file_cursor.write("%YAML 1.1\n---\nverbose: info\n")
+    config.load()
+    config.save()
+    other_config = Config(str(tmp_path / "other.yaml"))
+    other_config.data = {"verbose": "info"}
+
+    other_config.save()  # act
+
+    with open(other_config.config_path, "r", encoding="utf-8") as file_cursor:
+        assert file_cursor.read() == "verbose: info\n"
+
+
 def test_get_can_fetch_nested_items_with_dots(config: Config) -> None:
     """Fetching values of configuration keys using dot notation works."""
     config.data = {
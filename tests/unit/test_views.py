@@ -1,13 +1,22 @@
 """Test the representations of data."""
 
-from typing import Any
+from typing import Any, Tuple
 
+import pytest
 from _pytest.capture import CaptureFixture
 
 from drode import services, views
 from drode.adapters.aws import AWS
 from drode.config import Config
 
+# Table printed for the autoscaling group returned by the fake AWS adapter.
+_TABLE_HEADER = (
+    "Instance             IP            Status             Created           Template\n"
+    "-------------------  ------------  -----------------  ----------------  ----------------------\n"
+)
+_INSTANCE_ROW = "i-xxxxxxxxxxxxxxxxx  192.168.1.13  Healthy/InService  2020-06-08T11:29  old-launch-config-name\n"
+_ASG_TABLE = f"Active Template: launch-config-name\n{_TABLE_HEADER}{_INSTANCE_ROW}"
+
 
 def test_print_autoscaling_group_happy_path(
     aws: AWS, capsys: CaptureFixture[Any]
@@ -22,67 +31,40 @@ def test_print_autoscaling_group_happy_path(
     views.print_autoscaling_group_info(autoscaler_info)  # act
 
     out, err = capsys.readouterr()
-    assert out == (
-        "Active Template: launch-config-name\n"
-        "Instance             IP            Status             Created           Template\n"
-        "-------------------  ------------  -----------------  ----------------  ----------------------\n"
-        "i-xxxxxxxxxxxxxxxxx  192.168.1.13  Healthy/InService  2020-06-08T11:29  old-launch-config-name\n"
-    )
-    assert err == ""
-
-
-def test_print_status_happy_path(
-    aws: AWS, config: Config, capsys: CaptureFixture[Any]
-) -> None:
-    """
-    Given: The information of an autoscaling group, assuming it's equal for both
-        environments.
-    When: print_status is called.
-    Then: The expected result is printed.
-    """
-    project_status = services.project_status(config, aws)
-
-    views.print_status(project_status)  # act
-
-    out, err = capsys.readouterr()
-    assert out == (
-        "# Production\n"
-        "Active Template: launch-config-name\n"
-        "Instance             IP            Status             Created           Template\n"
-        "-------------------  ------------  -----------------  ----------------  ----------------------\n"
-        "i-xxxxxxxxxxxxxxxxx  192.168.1.13  Healthy/InService  2020-06-08T11:29  old-launch-config-name\n"
-        "\n"
-        "# Staging\n"
-        "Active Template: launch-config-name\n"
-        "Instance             IP            Status             Created           Template\n"
-        "-------------------  ------------  -----------------  ----------------  ----------------------\n"
-        "i-xxxxxxxxxxxxxxxxx  192.168.1.13  Healthy/InService  2020-06-08T11:29  old-launch-config-name\n"
-        "\n"
-    )
+    assert out == _ASG_TABLE
     assert err == ""
 
 
-def test_print_status_no_staging_key(
-    aws: AWS, config: Config, capsys: CaptureFixture[Any]
+@pytest.mark.parametrize(
+    ("removed_environments", "expected_out"),
+    [
+        ((), f"# Production\n{_ASG_TABLE}\n# Staging\n{_ASG_TABLE}\n"),
+        (("staging",), f"# Production\n{_ASG_TABLE}\n"),
+    ],
+    ids=["all_environments", "no_staging_key"],
+)
+def test_print_status(
+    aws: AWS,
+    config: Config,
+    capsys: CaptureFixture[Any],
+    removed_environments: Tuple[str, ...],
+    expected_out: str,
 ) -> None:
     """
-    Given: The information of an autoscaling group, assuming it's equal for both
-        environments.
+    Given: The information of an autoscaling group, assuming it's equal for all
+        the configured environments.
     When: print_status is called.
-    Then: The expected result is printed.
+    Then: The table of each configured environment is printed.
     """
-    del config["projects"]["test_project_1"]["aws"]["autoscaling_groups"]["staging"]
+    autoscaling_groups = config["projects"]["test_project_1"]["aws"][
+        "autoscaling_groups"
+    ]
+    for environment in removed_environments:
+        del autoscaling_groups[environment]
     project_status = services.project_status(config, aws)
 
     views.print_status(project_status)  # act
 
     out, err = capsys.readouterr()
-    assert out == (
-        "# Production\n"
-        "Active Template: launch-config-name\n"
-        "Instance             IP            Status             Created           Template\n"
-        "-------------------  ------------  -----------------  ----------------  ----------------------\n"
-        "i-xxxxxxxxxxxxxxxxx  192.168.1.13  Healthy/InService  2020-06-08T11:29  old-launch-config-name\n"
-        "\n"
-    )
+    assert out == expected_out
     assert err == ""